@@ -0,0 +1,24 @@
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import StreamingResponse
+from starlette.routing import Route
+
+from markupy import iter_async
+from markupy.elements import H1, Body, Html, Table, Td, Tr
+
+
+async def index(request: Request) -> StreamingResponse:
+    page = Html[
+        Body[
+            H1["Hi Starlette!"],
+            Table[(Tr[Td[row]] for row in range(100_000))],
+        ]
+    ]
+    # Rendering happens in a worker thread, the event loop stays responsive
+    return StreamingResponse(iter_async(page), media_type="text/html")
+
+
+# Run it with `uv run uvicorn streaming_response:app``
+app = Starlette(
+    routes=[Route("/", index)],
+)
@@ -0,0 +1,374 @@
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from markupy import Attributes, Component, View
+from markupy.elements import (
+    A,
+    Body,
+    Button,
+    Div,
+    Footer,
+    H1,
+    Head,
+    Header,
+    Html,
+    Input,
+    Li,
+    Main,
+    Nav,
+    P,
+    Span,
+    Table,
+    Tbody,
+    Td,
+    Th,
+    Thead,
+    Title,
+    Tr,
+    Ul,
+)
+
+# Benchmark suite of common rendering scenarios.
+#
+#   python scripts/bench.py --output before.json
+#   python scripts/bench.py --compare before.json
+#
+# Each scenario builds a tree and renders it entirely, after some warmup runs.
+# Timings of the repeated runs are summarized as percentiles (in ms).
+#
+#   python scripts/bench.py --memory
+#
+# Memory mode reports the memory retained by trees per built node, the memory
+# allocated by rendering per rendered node, and the peak memory of materialized
+# (str) versus streaming (iteration) rendering.
+
+
+def deep_nesting() -> None:
+    for _ in range(50):
+        node: View = Span["leaf"]
+        for _ in range(200):
+            node = Div[node]
+        str(node)
+
+
+def wide_tree() -> None:
+    str(Ul[(Li[item] for item in range(20_000))])
+
+
+htmx = Attributes(hx_boost="true", hx_target="#main", hx_swap="outerHTML")
+
+
+def attributes() -> None:
+    str(
+        Div[
+            (
+                Button(
+                    ".btn.btn-primary",
+                    htmx,
+                    {"aria-label": f"Action {i}"},
+                    type="button",
+                    disabled=i % 2 == 0,
+                    data_index=i,
+                )[Input(".form-control", name=f"field-{i}", value=i)]
+                for i in range(2_000)
+            )
+        ]
+    )
+
+
+@dataclass
+class Card(Component):
+    title: str
+    body: str
+
+    def render(self) -> View:
+        return Div(".card")[
+            Div(".card-header")[self.title],
+            Div(".card-body")[P[self.body], self.render_content()],
+        ]
+
+
+def components() -> None:
+    str(
+        Div[
+            (
+                Card(f"Card {i}", "Lorem ipsum")[A(href="#")["More"]]
+                for i in range(2_000)
+            )
+        ]
+    )
+
+
+class Layout(Component):
+    def __init__(self, title: str) -> None:
+        super().__init__()
+        self.title = title
+
+    def render(self) -> View:
+        return Html[
+            Head[Title[self.title]],
+            Body[
+                Header[Nav[Ul[(Li[A(href=f"/{i}")[f"Link {i}"]] for i in range(20))]]],
+                Main[H1[self.title], self.render_content()],
+                Footer["Footer"],
+            ],
+        ]
+
+
+def layouts() -> None:
+    for page in range(200):
+        str(Layout(f"Page {page}")[(P[f"Paragraph {i}"] for i in range(20))])
+
+
+text = '<script>alert("Tom & Jerry\'s")</script> ' * 4
+
+
+def escaping() -> None:
+    str(Div[(P[text] for _ in range(5_000))])
+
+
+def big_table() -> None:
+    str(
+        Table[
+            Thead[Tr[Th["Row #"]]],
+            Tbody[(Tr(".row")[Td(data_value=row)[row]] for row in range(10_000))],
+        ]
+    )
+
+
+def streaming() -> None:
+    page = Table[
+        Thead[Tr[Th["Row #"]]],
+        Tbody[(Tr(".row")[Td(data_value=row)[row]] for row in range(10_000))],
+    ]
+    # Chunks are consumed one by one, the whole page is never joined
+    for _ in page:
+        pass
+
+
+scenarios: dict[str, Callable[[], None]] = {
+    func.__name__: func
+    for func in (
+        deep_nesting,
+        wide_tree,
+        attributes,
+        components,
+        layouts,
+        escaping,
+        big_table,
+        streaming,
+    )
+}
+
+
+def measure(func: Callable[[], None], warmup: int, repeat: int) -> list[float]:
+    for _ in range(warmup):
+        func()
+    timings: list[float] = []
+    for _ in range(repeat):
+        # Garbage of previous runs must not be collected during the timed run
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1_000)
+    return timings
+
+
+def summarize(timings: list[float]) -> dict[str, float]:
+    percentiles = statistics.quantiles(timings, n=100, method="inclusive")
+    return {
+        "min": min(timings),
+        "mean": statistics.fmean(timings),
+        "stdev": statistics.stdev(timings),
+        "p50": statistics.median(timings),
+        "p90": percentiles[89],
+        "p99": percentiles[98],
+        "max": max(timings),
+    }
+
+
+# Memory scenarios return a tree, the number of nodes (elements and components)
+# it holds once built, and the number of nodes it renders.
+# Trees are built from lists, so that they are fully materialized.
+
+
+def memory_big_table() -> tuple[View, int, int]:
+    rows = 10_000
+    view = Table[
+        Thead[Tr[Th["Row #"]]],
+        Tbody[[Tr(".row")[Td(data_value=row)[row]] for row in range(rows)]],
+    ]
+    return view, 2 * rows + 4, 2 * rows + 4
+
+
+def memory_nested_components() -> tuple[View, int, int]:
+    cards = 2_000
+    # Components only build their elements when rendered (4 per card), so the
+    # built tree holds a card and its link per card
+    view = Div[
+        [Card(f"Card {i}", "Lorem ipsum")[A(href="#")["More"]] for i in range(cards)]
+    ]
+    return view, 2 * cards + 1, 6 * cards + 1
+
+
+def memory_lazy_generators() -> tuple[View, int, int]:
+    items = 20_000
+    # Generators are consumed when assigned as children
+    view = Ul[(Li[item] for item in range(items))]
+    return view, items + 1, items + 1
+
+
+memory_scenarios: dict[str, Callable[[], tuple[View, int, int]]] = {
+    func.__name__.removeprefix("memory_"): func
+    for func in (memory_big_table, memory_nested_components, memory_lazy_generators)
+}
+
+
+def _collections() -> int:
+    return sum(generation["collections"] for generation in gc.get_stats())
+
+
+def _blocks() -> int:
+    return sum(
+        stat.count for stat in tracemalloc.take_snapshot().statistics("filename")
+    )
+
+
+def measure_memory(build: Callable[[], tuple[View, int, int]]) -> dict[str, float]:
+    """Memory retained by a tree and memory allocated while rendering it, in bytes.
+
+    CPython exposes no total allocations counter: allocations are reported as
+    live memory blocks and as the number of gc collections they triggered.
+    Build metrics are per node of the built tree, render metrics per rendered
+    node, since components only build their elements when rendered.
+    """
+    build()  # Warmup of caches (elements, attributes...)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        collections = _collections()
+        view, nodes, rendered_nodes = build()
+        built, build_peak = tracemalloc.get_traced_memory()
+        build_collections = _collections() - collections
+        blocks = _blocks()
+
+        tracemalloc.reset_peak()
+        collections = _collections()
+        str(view)
+        materialized_peak = tracemalloc.get_traced_memory()[1] - built
+        materialized_collections = _collections() - collections
+
+        tracemalloc.reset_peak()
+        collections = _collections()
+        # Chunks are consumed one by one, the whole page is never joined
+        for _ in view:
+            pass
+        streaming_peak = tracemalloc.get_traced_memory()[1] - built
+        streaming_collections = _collections() - collections
+
+        # Chunks are kept alive to count the blocks allocated by rendering
+        chunks = list(view)
+        render_bytes = tracemalloc.get_traced_memory()[0] - built
+        render_blocks = _blocks() - blocks
+        del chunks
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "nodes": nodes,
+        "build_bytes": built,
+        "build_peak": build_peak,
+        "bytes_per_node": built / nodes,
+        "blocks_per_node": blocks / nodes,
+        "build_collections": build_collections,
+        "rendered_nodes": rendered_nodes,
+        "render_bytes_per_node": render_bytes / rendered_nodes,
+        "render_blocks_per_node": render_blocks / rendered_nodes,
+        "materialized_peak": materialized_peak,
+        "materialized_collections": materialized_collections,
+        "streaming_peak": streaming_peak,
+        "streaming_collections": streaming_collections,
+    }
+
+
+def compare(results: dict[str, Any], previous: dict[str, Any], metric: str) -> None:
+    print(f"\n{'scenario':<24} {'before':>12} {'after':>12} {'change':>8}  ({metric})")
+    for name, stats in results["scenarios"].items():
+        if (before := previous["scenarios"].get(name)) is None or metric not in before:
+            continue
+        change = (stats[metric] / before[metric] - 1) * 100
+        print(
+            f"{name:<24} {before[metric]:>12.3f} {stats[metric]:>12.3f} {change:>+7.1f}%"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="markupy benchmark suite")
+    parser.add_argument(
+        "scenario",
+        nargs="*",
+        help=f"timing: {', '.join(scenarios)}; memory: {', '.join(memory_scenarios)}",
+    )
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument(
+        "--memory", action="store_true", help="measure memory instead of time"
+    )
+    parser.add_argument("--output", help="JSON file to write results to")
+    parser.add_argument("--compare", help="JSON file of a previous run")
+    args = parser.parse_args()
+    available = memory_scenarios if args.memory else scenarios
+    if args.repeat < 2:
+        parser.error("--repeat must be at least 2")
+    if unknown := set(args.scenario) - set(available):
+        parser.error(f"unknown scenario(s): {', '.join(sorted(unknown))}")
+
+    results: dict[str, Any] = {
+        "python": sys.version,
+        "platform": platform.platform(),
+        "scenarios": {},
+    }
+    if args.memory:
+        results["mode"] = "memory"
+        columns = (
+            "bytes_per_node",
+            "blocks_per_node",
+            "render_bytes_per_node",
+            "render_blocks_per_node",
+            "build_peak",
+            "materialized_peak",
+            "streaming_peak",
+        )
+        print(f"{'scenario':<24}" + "".join(f"{stat:>24}" for stat in columns))
+        for name in args.scenario or memory_scenarios:
+            stats = measure_memory(memory_scenarios[name])
+            results["scenarios"][name] = stats
+            print(f"{name:<24}" + "".join(f"{stats[stat]:>24,.1f}" for stat in columns))
+    else:
+        results.update(mode="time", warmup=args.warmup, repeat=args.repeat)
+        columns = ("min", "p50", "p90", "p99", "stdev")
+        print(
+            f"{'scenario':<24}" + "".join(f"{stat:>10}" for stat in columns) + "  (ms)"
+        )
+        for name in args.scenario or scenarios:
+            stats = summarize(measure(scenarios[name], args.warmup, args.repeat))
+            results["scenarios"][name] = stats
+            print(f"{name:<24}" + "".join(f"{stats[stat]:>10.3f}" for stat in columns))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            compare(
+                results, json.load(f), "materialized_peak" if args.memory else "p50"
+            )
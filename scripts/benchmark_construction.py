@@ -0,0 +1,59 @@
+import timeit
+
+from markupy import Attribute
+from markupy.elements import Div, Td, Tr
+
+# Micro-benchmarks of the construction of elements (no rendering involved)
+
+
+def bare() -> None:
+    Tr[Td["cell"]]
+
+
+def selector() -> None:
+    Tr(".row")[Td["cell"]]
+
+
+row = Tr(".row").prototype()
+
+
+def prototype() -> None:
+    row[Td["cell"]]
+
+
+def selector_id() -> None:
+    Tr("#row-1.row.odd")[Td["cell"]]
+
+
+def kwargs() -> None:
+    Tr(".row")[Td(data_value=1, title="cell")["cell"]]
+
+
+def mixed() -> None:
+    Td("#id-1.foo.bar", {"hello": "world"}, data_value=1)[1]
+
+
+def attribute_obj() -> None:
+    Div(Attribute("hello", "world"), id="foo")
+
+
+def no_args() -> None:
+    Div()[Div()]
+
+
+benchmarks = [
+    bare,
+    selector,
+    prototype,
+    selector_id,
+    kwargs,
+    mixed,
+    attribute_obj,
+    no_args,
+]
+
+if __name__ == "__main__":
+    number = 100_000
+    for benchmark in benchmarks:
+        best = min(timeit.repeat(benchmark, number=number, repeat=5))
+        print(f"{benchmark.__name__:<16} {best / number * 1_000_000:.3f} µs")
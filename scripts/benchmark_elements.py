@@ -0,0 +1,47 @@
+import subprocess
+import sys
+import timeit
+
+# Benchmarks of the import of the elements module and of the access to elements
+
+
+def import_time(repeat: int = 10) -> float:
+    """Best wall time (in seconds) of a fresh interpreter importing elements."""
+    code = (
+        "import time; start = time.perf_counter();"
+        "import markupy.elements;"
+        "print(time.perf_counter() - start)"
+    )
+    return min(
+        float(subprocess.check_output([sys.executable, "-c", code]))
+        for _ in range(repeat)
+    )
+
+
+def first_access(name: str, repeat: int = 10) -> float:
+    """Best wall time (in seconds) of the first access to an element."""
+    code = (
+        "import time; import markupy.elements as el;"
+        "start = time.perf_counter();"
+        f"el.{name};"
+        "print(time.perf_counter() - start)"
+    )
+    return min(
+        float(subprocess.check_output([sys.executable, "-c", code]))
+        for _ in range(repeat)
+    )
+
+
+if __name__ == "__main__":
+    print(f"{'import':<28} {import_time() * 1_000:.3f} ms")
+    for name in ("Div", "MyCustomElement"):
+        print(f"{'first access ' + name:<28} {first_access(name) * 1_000_000:.3f} µs")
+
+    import markupy.elements as el
+
+    number = 1_000_000
+    for statement in ("el.Div", "el.MyCustomElement"):
+        best = min(
+            timeit.repeat(statement, globals={"el": el}, number=number, repeat=5)
+        )
+        print(f"{statement:<28} {best / number * 1_000_000_000:.3f} ns")
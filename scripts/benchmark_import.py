@@ -0,0 +1,46 @@
+import argparse
+import subprocess
+import sys
+
+# Import time regression benchmark, based on `python -X importtime`
+
+
+def import_time(module: str) -> dict[str, int]:
+    """Cumulative import time (in µs) of each module imported by `module`."""
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stderr
+    times: dict[str, int] = {}
+    for line in output.splitlines()[1:]:
+        # import time: self [us] | cumulative | imported package
+        _, cumulative, name = line.split("|")
+        if name.strip() == "site":
+            # Interpreter startup, not caused by the benchmarked import
+            times.clear()
+        else:
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("module", nargs="?", default="markupy")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument(
+        "--max-ms", type=float, help="fail if the best import time exceeds it"
+    )
+    args = parser.parse_args()
+
+    runs = [import_time(args.module) for _ in range(args.repeat)]
+    best = min(runs, key=lambda times: times[args.module])
+    for name, cumulative in sorted(best.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"{name:<48} {cumulative / 1_000:.3f} ms")
+
+    total = best[args.module] / 1_000
+    print(f"\nimport {args.module}: {total:.3f} ms (best of {args.repeat})")
+    if args.max_ms is not None and total > args.max_ms:
+        sys.exit(f"Import time regression: {total:.3f} ms > {args.max_ms} ms")
@@ -0,0 +1,53 @@
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from markupy.elements import Table, Tbody, Td, Th, Thead, Tr
+
+# Renders big table pages from N threads and reports the throughput scaling.
+# On a free-threaded build of CPython (3.13t+), throughput is expected to grow
+# with the number of threads until all cores are busy.
+
+rows = list(range(5_000))
+pages = 64
+
+
+def render_page() -> str:
+    return str(
+        Table[
+            Thead[Tr[Th["Row #"]]],
+            Tbody[
+                (
+                    Tr(".row")[
+                        Td(f"#id-{row}.foo.bar", {"hello": "world"}, data_value=row)[
+                            row
+                        ]
+                    ]
+                    for row in rows
+                )
+            ],
+        ]
+    )
+
+
+def run(threads: int) -> float:
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        start = time.perf_counter()
+        for _ in executor.map(lambda _: render_page(), range(pages)):
+            pass
+        return pages / (time.perf_counter() - start)
+
+
+is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+print(f"Python {sys.version} (GIL {'enabled' if is_gil_enabled else 'disabled'})")
+
+render_page()  # warmup
+baseline = run(1)
+threads = 1
+while threads <= (os.cpu_count() or 1):
+    throughput = baseline if threads == 1 else run(threads)
+    print(
+        f"{threads:>3} threads: {throughput:7.2f} pages/s (x{throughput / baseline:.2f})"
+    )
+    threads *= 2
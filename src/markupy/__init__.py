@@ -1,15 +1,85 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from ._private.attributes import Attribute, attribute_handlers
-from ._private.html_to_markupy import html_to_markupy
+from ._private.mode import set_strict_mode, strict_mode
 from ._private.views import Component, View
 from ._private.views import Fragment as _Fragment
 
+if TYPE_CHECKING:
+    from ._private.attributes import Attributes, JsonValue
+    from ._private.attributes.cache import set_attribute_cache_size
+    from ._private.html_to_markupy import html_to_markupy
+    from ._private.loader import Loader
+    from ._private.views import component_slots
+    from ._private.views.compact import CompactBuilder
+    from ._private.views.concurrent import ConcurrentFragment as _ConcurrentFragment
+    from ._private.views.concurrent import ShardedView as Sharded
+    from ._private.views.interning import Interner
+    from ._private.views.json_script import JsonScript
+    from ._private.views.ref import Ref
+    from ._private.views.stream import iter_async
+
+    Concurrent: _ConcurrentFragment
+
 __all__ = [
     "Attribute",
+    "Attributes",
+    "CompactBuilder",
     "Component",
+    "Concurrent",
     "Fragment",
+    "Interner",
+    "JsonScript",
+    "JsonValue",
+    "Loader",
+    "Ref",
+    "Sharded",
     "View",
     "attribute_handlers",
+    "component_slots",
     "html_to_markupy",
+    "iter_async",
+    "set_attribute_cache_size",
+    "set_strict_mode",
+    "strict_mode",
 ]
 
 Fragment = _Fragment()
+
+# Less common features, some of them pulling heavy dependencies (asyncio,
+# multiprocessing, html.parser...): imported on first access to keep startup fast
+_lazy: dict[str, tuple[str, str]] = {
+    "Attributes": ("._private.attributes", "Attributes"),
+    "CompactBuilder": ("._private.views.compact", "CompactBuilder"),
+    "Concurrent": ("._private.views.concurrent", "ConcurrentFragment"),
+    "Interner": ("._private.views.interning", "Interner"),
+    "JsonScript": ("._private.views.json_script", "JsonScript"),
+    "JsonValue": ("._private.attributes", "JsonValue"),
+    "Loader": ("._private.loader", "Loader"),
+    "Ref": ("._private.views.ref", "Ref"),
+    "Sharded": ("._private.views.concurrent", "ShardedView"),
+    "component_slots": ("._private.views", "component_slots"),
+    "html_to_markupy": ("._private.html_to_markupy", "html_to_markupy"),
+    "iter_async": ("._private.views.stream", "iter_async"),
+    "set_attribute_cache_size": (
+        "._private.attributes.cache",
+        "set_attribute_cache_size",
+    ),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module, attr = _lazy[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module, __name__), attr)
+    if name == "Concurrent":
+        value = value()
+    # Stored in the module namespace, so that this function is only called once
+    return globals().setdefault(name, value)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
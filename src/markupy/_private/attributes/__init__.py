@@ -1,5 +1,12 @@
 from .attribute import Attribute
 from .handlers import attribute_handlers
-from .store import AttributeStore
+from .json_value import JsonValue
+from .store import Attributes, AttributeStore
 
-__all__ = ["attribute_handlers", "Attribute", "AttributeStore"]
+__all__ = [
+    "attribute_handlers",
+    "Attribute",
+    "Attributes",
+    "AttributeStore",
+    "JsonValue",
+]
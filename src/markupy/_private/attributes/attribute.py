@@ -5,6 +5,8 @@ from markupsafe import escape
 
 from markupy.exceptions import MarkupyError
 
+from .json_value import JsonValue
+
 
 @lru_cache(maxsize=1000)
 def is_valid_key(key: Any) -> bool:
@@ -19,6 +21,17 @@ def is_valid_key(key: Any) -> bool:
     )
 
 
+def render_attribute(name: str, value: Any) -> str:
+    if value is None or value is False:
+        # Discard False and None valued attributes for all attributes
+        return ""
+    elif value is True:
+        return name
+    elif type(value) is JsonValue:
+        return f'{name}="{value.escaped}"'
+    return f'{name}="{escape(str(value))}"'
+
+
 def is_valid_value(value: Any) -> bool:
     return isinstance(value, Attribute.Value)
 
@@ -56,12 +69,23 @@ class Attribute:
         self._value = value
 
     def __str__(self) -> str:
-        if self.value is None or self.value is False:
-            # Discard False and None valued attributes for all attributes
-            return ""
-        elif self.value is True:
-            return self.name
-        return f'{self.name}="{escape(str(self.value))}"'
+        return render_attribute(self.name, self.value)
 
     def __repr__(self) -> str:
         return f"<markupy.Attribute.{self.name}>"
+
+
+class ConstantAttribute(Attribute):
+    """Immutable attribute, safe to be shared between elements."""
+
+    __slots__ = ()
+
+    @property
+    def value(self) -> Attribute.Value:
+        return self._value
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        if hasattr(self, "_value"):
+            raise MarkupyError(f"Attribute `{self.name}` is immutable")
+        Attribute.value.fset(self, value)  # type: ignore[attr-defined]
@@ -0,0 +1,119 @@
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from threading import Lock
+from typing import Any
+
+from markupy.exceptions import MarkupyError
+
+from ..mode import is_strict_mode
+from .attribute import ConstantAttribute
+from .handlers import AttributeHandler, attribute_handlers
+from .store import Attributes
+
+
+def signature_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable | None:
+    """Hashable key of attribute arguments, or None if they can't be cached.
+
+    Values are tagged with their type: True, 1 and 1.0 are equal and hash the
+    same in Python, but they render differently.
+    """
+    if "id" in kwargs:
+        # Ids are meant to be unique, caching them would only evict useful entries
+        return None
+    key: list[Hashable] = [is_strict_mode(), attribute_handlers.scope_key()]
+    for arg in args:
+        if isinstance(arg, str):
+            if arg.startswith("#"):
+                return None
+            key += arg, type(arg)
+        elif arg is None:
+            key.append(None)
+        elif isinstance(arg, tuple):
+            key += tuple, arg, tuple(map(type, arg))
+        elif isinstance(arg, dict) or isinstance(arg, Mapping):
+            values = arg.values()  # type: ignore[unused-ignore]
+            key += Mapping, tuple(arg.items()), tuple(map(type, values))
+        elif isinstance(arg, Attributes) or type(arg) is ConstantAttribute:
+            # Bundles and constant attributes are immutable, they can be
+            # compared by identity
+            key.append(arg)
+        else:
+            # Other Attribute objects are mutable
+            return None
+    if kwargs:
+        key += tuple(kwargs.items()), tuple(map(type, kwargs.values()))
+    return tuple(key)
+
+
+class AttributeCache:
+    """Bounded cache of rendered attribute strings, evicted in FIFO order.
+
+    The whole cache is invalidated whenever global attribute handlers are changed,
+    handlers of scoped overlays are part of the keys. A size of 0 disables it.
+    """
+
+    __slots__ = ("_chain", "_lock", "_maxsize", "_values")
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self._maxsize = maxsize
+        # Reads don't need to lock, writes are serialized to keep the bound
+        self._lock = Lock()
+        self._chain = attribute_handlers._chain
+        # Unlike dict, OrderedDict evicts its oldest entry in constant time
+        self._values: OrderedDict[Hashable, str] = OrderedDict()
+
+    def get(self, key: Hashable) -> str | None:
+        if self._chain is not attribute_handlers._chain:
+            return None
+        try:
+            return self._values.get(key)
+        except TypeError:
+            # Unhashable values, that will be rejected by validation
+            return None
+
+    def set(
+        self, key: Hashable, value: str, chain: tuple[AttributeHandler, ...]
+    ) -> None:
+        """Store a value computed with the given handlers chain."""
+        with self._lock:
+            if chain is not attribute_handlers._chain or self._maxsize == 0:
+                # Handlers changed or cache disabled while the value was
+                # being computed
+                return
+            if chain is not self._chain:
+                self._values.clear()
+                self._chain = chain
+            while len(self._values) >= self._maxsize and self._values:
+                self._values.popitem(last=False)
+            self._values[key] = value
+
+    @property
+    def enabled(self) -> bool:
+        return self._maxsize > 0
+
+    def resize(self, maxsize: int) -> None:
+        if maxsize < 0:
+            raise MarkupyError(f"Invalid value {maxsize!r} for `maxsize`")
+        with self._lock:
+            self._maxsize = maxsize
+            self._values.clear()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+attribute_cache = AttributeCache()
+
+
+def set_attribute_cache_size(maxsize: int) -> None:
+    """Set the number of call signatures whose rendered attributes are cached.
+
+    Handlers are not called again for cached signatures: disable the cache
+    (with a size of 0) if some handlers depend on state other than their
+    parameters, such as the current request.
+    """
+    attribute_cache.resize(maxsize)
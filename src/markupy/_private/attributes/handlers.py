@@ -1,5 +1,8 @@
-from collections.abc import Iterator
-from typing import Callable, TypeAlias
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from typing import Callable, TypeAlias, overload
 
 from markupy.exceptions import MarkupyError
 
@@ -12,20 +15,158 @@ from .attribute import Attribute
 #   an attribute that has already been instanciated with a None value
 AttributeHandler: TypeAlias = Callable[[Attribute | None, Attribute], Attribute | None]
 
+# Attribute names and name prefixes a handler is restricted to (None if unrestricted)
+HandlerFilter: TypeAlias = tuple[frozenset[str] | None, tuple[str, ...] | None]
 
-class AttributeHandlerRegistry(dict[AttributeHandler, None]):
-    def register(self, handler: AttributeHandler) -> AttributeHandler:
-        """Registers the handler and returns it unchanged (so usable as a decorator)."""
-        if handler in self:
-            raise MarkupyError(f"Handler {handler.__name__} is already registered.")
-        self[handler] = None
+
+# Number of attribute names whose handlers chain is kept by a registry
+_MAX_CACHED_CHAINS = 1024
+
+
+def _matches(name: str, filter: HandlerFilter) -> bool:
+    names, prefixes = filter
+    if names is None and prefixes is None:
+        return True
+    return (names is not None and name in names) or (
+        prefixes is not None and name.startswith(prefixes)
+    )
+
+
+class AttributeHandlerRegistry(dict[AttributeHandler, HandlerFilter]):
+    __slots__ = ("_chain", "_chains", "_lock")
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Writers are serialized by the lock and publish an immutable snapshot
+        # of the handlers chain, so that readers never need to lock
+        self._lock = Lock()
+        self._chain: tuple[AttributeHandler, ...] = ()
+        self._chains: tuple[
+            tuple[tuple[AttributeHandler, HandlerFilter], ...],
+            dict[str, tuple[AttributeHandler, ...]],
+        ] = ((), {})
+
+    def _publish(self) -> None:
+        dispatch = tuple(reversed(self.items()))
+        # Chains by attribute name are computed lazily from the new snapshot
+        self._chains = (dispatch, {})
+        # Published last: caches holding the previous chain get invalidated
+        # only once the new dispatch chains are visible
+        self._chain = tuple(handler for handler, _ in dispatch)
+
+    @overload
+    def register(
+        self,
+        handler: AttributeHandler,
+        *,
+        names: Iterable[str] | None = None,
+        prefix: str | tuple[str, ...] | None = None,
+    ) -> AttributeHandler: ...
+    @overload
+    def register(
+        self,
+        handler: None = None,
+        *,
+        names: Iterable[str] | None = None,
+        prefix: str | tuple[str, ...] | None = None,
+    ) -> Callable[[AttributeHandler], AttributeHandler]: ...
+    def register(
+        self,
+        handler: AttributeHandler | None = None,
+        *,
+        names: Iterable[str] | None = None,
+        prefix: str | tuple[str, ...] | None = None,
+    ) -> AttributeHandler | Callable[[AttributeHandler], AttributeHandler]:
+        """Registers the handler and returns it unchanged (so usable as a decorator).
+
+        When `names` and/or `prefix` are provided, the handler is only called
+        for attributes matching one of these names or prefixes.
+        """
+        if handler is None:
+            # Decorator with arguments: @register(names=...)
+            return lambda handler: self.register(handler, names=names, prefix=prefix)
+
+        if isinstance(names, str):
+            names = (names,)
+        filter: HandlerFilter = (
+            None if names is None else frozenset(names),
+            (prefix,) if isinstance(prefix, str) else prefix,
+        )
+        with self._lock:
+            if handler in self:
+                raise MarkupyError(f"Handler {handler.__name__} is already registered.")
+            self[handler] = filter
+            self._publish()
         return handler  # Important for decorator usage
 
     def unregister(self, handler: AttributeHandler) -> None:
-        self.pop(handler, None)
+        with self._lock:
+            self.pop(handler, None)
+            self._publish()
+
+    def chain_for(self, name: str) -> tuple[AttributeHandler, ...]:
+        """Handlers to be called for a given attribute name, most recent first."""
+        dispatch, chains = self._chains
+        try:
+            return chains[name]
+        except KeyError:
+            chain = tuple(
+                handler for handler, filter in dispatch if _matches(name, filter)
+            )
+            if len(chains) >= _MAX_CACHED_CHAINS:
+                # Dynamic names (data-*, hx-*...) must not grow the cache forever
+                return chain
+            return chains.setdefault(name, chain)
 
     def __iter__(self) -> Iterator[AttributeHandler]:
-        yield from reversed(self.keys())
+        return iter(self._chain)
+
+
+# Overlays active in the current context, innermost first
+_overlays: ContextVar[tuple[AttributeHandlerRegistry, ...]] = ContextVar(
+    "markupy_attribute_handlers", default=()
+)
+
+
+class GlobalAttributeHandlerRegistry(AttributeHandlerRegistry):
+    __slots__ = ()
+
+    def overlay(self) -> AttributeHandlerRegistry:
+        """Create an empty registry to be activated later with `scope()`."""
+        return AttributeHandlerRegistry()
+
+    @contextmanager
+    def scope(
+        self, overlay: AttributeHandlerRegistry | None = None
+    ) -> Iterator[AttributeHandlerRegistry]:
+        """Stack handlers on top of global ones, for the current context only.
+
+        Handlers of the overlay are called before global handlers. Overlays can
+        be created once with `overlay()` and then activated as often as needed.
+        """
+        if overlay is None:
+            overlay = self.overlay()
+        token = _overlays.set((overlay, *_overlays.get()))
+        try:
+            yield overlay
+        finally:
+            _overlays.reset(token)
+
+    def scope_key(
+        self,
+    ) -> tuple[tuple[tuple[AttributeHandler, HandlerFilter], ...], ...]:
+        """Hashable state of the overlays active in the current context."""
+        if overlays := _overlays.get():
+            return tuple(overlay._chains[0] for overlay in overlays)
+        return ()
+
+    def chain_for(self, name: str) -> tuple[AttributeHandler, ...]:
+        chain = super().chain_for(name)
+        if overlays := _overlays.get():
+            # Overlays keep precompiled chains too, only concatenation is needed
+            for overlay in reversed(overlays):
+                chain = overlay.chain_for(name) + chain
+        return chain
 
 
-attribute_handlers = AttributeHandlerRegistry()
+attribute_handlers = GlobalAttributeHandlerRegistry()
@@ -1,14 +1,39 @@
 from collections.abc import Iterable, Mapping
+from functools import lru_cache
 from typing import Callable, Literal
 
+from markupy.exceptions import MarkupyError
+
 from . import Attribute
+from .attribute import ConstantAttribute
 from .store import python_to_html_key
 
+
+@lru_cache(maxsize=1000)
+def _cached_constant(name: str, value: Attribute.Value, _: type) -> Attribute:
+    # Value type is part of the cache key: True == 1 but they render differently
+    return ConstantAttribute(name, value)
+
+
+def _constant(name: str, value: Attribute.Value) -> Attribute:
+    try:
+        return _cached_constant(name, value, type(value))  # type: ignore[arg-type]
+    except TypeError:
+        # Unhashable (hence invalid) value, let validation report it
+        return ConstantAttribute(name, value)
+
+
 # Special functions
 
 
+@lru_cache(maxsize=1000)
 def getattr(name: str) -> Callable[[Attribute.Value], Attribute]:
-    return lambda value: Attribute(python_to_html_key(name), value)
+    try:
+        html_name = python_to_html_key(name)
+    except MarkupyError:
+        # Invalid names only fail when the attribute gets instantiated
+        return lambda value: Attribute(python_to_html_key(name), value)
+    return lambda value: Attribute(html_name, value)
 
 
 # Html Attributes
@@ -47,25 +72,25 @@ def as_(value: str) -> Attribute:
 
 
 def async_(value: bool = True) -> Attribute:
-    return Attribute("async", value)
+    return _constant("async", value)
 
 
 def autocapitalize(
     value: Literal["off", "none", "on", "sentences", "words", "characters"],
 ) -> Attribute:
-    return Attribute("autocapitalize", value)
+    return _constant("autocapitalize", value)
 
 
 def autocomplete(value: Literal["on", "off"]) -> Attribute:
-    return Attribute("autocomplete", value)
+    return _constant("autocomplete", value)
 
 
 def autofocus(value: bool = True) -> Attribute:
-    return Attribute("autofocus", value)
+    return _constant("autofocus", value)
 
 
 def autoplay(value: bool = True) -> Attribute:
-    return Attribute("autoplay", value)
+    return _constant("autoplay", value)
 
 
 def background(value: str) -> Attribute:
@@ -89,7 +114,7 @@ def charset(value: str) -> Attribute:
 
 
 def checked(value: bool = True) -> Attribute:
-    return Attribute("checked", value)
+    return _constant("checked", value)
 
 
 def cite(value: str) -> Attribute:
@@ -124,11 +149,11 @@ def content(value: str) -> Attribute:
 
 
 def contenteditable(value: Literal["true", "false", ""]) -> Attribute:
-    return Attribute("contenteditable", value)
+    return _constant("contenteditable", value)
 
 
 def controls(value: bool = True) -> Attribute:
-    return Attribute("controls", value)
+    return _constant("controls", value)
 
 
 def coords(value: str) -> Attribute:
@@ -136,7 +161,7 @@ def coords(value: str) -> Attribute:
 
 
 def crossorigin(value: Literal["anonymous", "use-credentials"]) -> Attribute:
-    return Attribute("crossorigin", value)
+    return _constant("crossorigin", value)
 
 
 def csp(value: str) -> Attribute:
@@ -152,19 +177,19 @@ def datetime(value: str) -> Attribute:
 
 
 def decoding(value: Literal["sync", "async", "auto"]) -> Attribute:
-    return Attribute("decoding", value)
+    return _constant("decoding", value)
 
 
 def default(value: bool = True) -> Attribute:
-    return Attribute("default", value)
+    return _constant("default", value)
 
 
 def defer(value: bool = True) -> Attribute:
-    return Attribute("defer", value)
+    return _constant("defer", value)
 
 
 def dir(value: Literal["ltr", "rtl", "auto"]) -> Attribute:
-    return Attribute("dir", value)
+    return _constant("dir", value)
 
 
 def dirname(value: str) -> Attribute:
@@ -172,7 +197,7 @@ def dirname(value: str) -> Attribute:
 
 
 def disabled(value: bool = True) -> Attribute:
-    return Attribute("disabled", value)
+    return _constant("disabled", value)
 
 
 def download(value: str) -> Attribute:
@@ -180,7 +205,7 @@ def download(value: str) -> Attribute:
 
 
 def draggable(value: Literal["true", "false", "auto"]) -> Attribute:
-    return Attribute("draggable", value)
+    return _constant("draggable", value)
 
 
 def enctype(
@@ -188,13 +213,13 @@ def enctype(
         "application/x-www-form-urlencoded", "multipart/form-data", "text/plain"
     ],
 ) -> Attribute:
-    return Attribute("enctype", value)
+    return _constant("enctype", value)
 
 
 def enterkeyhint(
     value: Literal["enter", "done", "go", "next", "previous", "search", "send"],
 ) -> Attribute:
-    return Attribute("enterkeyhint", value)
+    return _constant("enterkeyhint", value)
 
 
 def elementtiming(value: str) -> Attribute:
@@ -218,15 +243,15 @@ def formenctype(
         "application/x-www-form-urlencoded", "multipart/form-data", "text/plain"
     ],
 ) -> Attribute:
-    return Attribute("formenctype", value)
+    return _constant("formenctype", value)
 
 
 def formmethod(value: Literal["get", "post"]) -> Attribute:
-    return Attribute("formmethod", value)
+    return _constant("formmethod", value)
 
 
 def formnovalidate(value: bool = True) -> Attribute:
-    return Attribute("formnovalidate", value)
+    return _constant("formnovalidate", value)
 
 
 def formtarget(value: str) -> Attribute:
@@ -242,7 +267,7 @@ def height(value: int | str) -> Attribute:
 
 
 def hidden(value: bool | Literal["until-found"] = True) -> Attribute:
-    return Attribute("hidden", value)
+    return _constant("hidden", value)
 
 
 def high(value: str) -> Attribute:
@@ -262,7 +287,7 @@ def http_equiv(
         "content-security-policy", "content-type", "default-style", "refresh"
     ],
 ) -> Attribute:
-    return Attribute("http-equiv", value)
+    return _constant("http-equiv", value)
 
 
 def id(value: str) -> Attribute:
@@ -274,7 +299,7 @@ def inputmode(
         "none", "text", "decimal", "numeric", "tel", "search", "email", "url"
     ],
 ) -> Attribute:
-    return Attribute("inputmode", value)
+    return _constant("inputmode", value)
 
 
 def integrity(value: str) -> Attribute:
@@ -282,7 +307,7 @@ def integrity(value: str) -> Attribute:
 
 
 def ismap(value: bool = True) -> Attribute:
-    return Attribute("ismap", value)
+    return _constant("ismap", value)
 
 
 def itemprop(value: str) -> Attribute:
@@ -292,7 +317,7 @@ def itemprop(value: str) -> Attribute:
 def kind(
     value: Literal["subtitles", "captions", "descriptions", "chapters", "metadata"],
 ) -> Attribute:
-    return Attribute("kind", value)
+    return _constant("kind", value)
 
 
 def label(value: str) -> Attribute:
@@ -304,7 +329,7 @@ def lang(value: str) -> Attribute:
 
 
 def loading(value: Literal["eager", "lazy"]) -> Attribute:
-    return Attribute("loading", value)
+    return _constant("loading", value)
 
 
 def list_(value: str) -> Attribute:
@@ -312,7 +337,7 @@ def list_(value: str) -> Attribute:
 
 
 def loop(value: bool = True) -> Attribute:
-    return Attribute("loop", value)
+    return _constant("loop", value)
 
 
 def low(value: str) -> Attribute:
@@ -332,7 +357,7 @@ def media(value: str) -> Attribute:
 
 
 def method(value: Literal["get", "post"]) -> Attribute:
-    return Attribute("method", value)
+    return _constant("method", value)
 
 
 def min(value: int | float | str) -> Attribute:
@@ -344,11 +369,11 @@ def minlength(value: int) -> Attribute:
 
 
 def multiple(value: bool = True) -> Attribute:
-    return Attribute("multiple", value)
+    return _constant("multiple", value)
 
 
 def muted(value: bool = True) -> Attribute:
-    return Attribute("muted", value)
+    return _constant("muted", value)
 
 
 def name(value: str) -> Attribute:
@@ -356,7 +381,7 @@ def name(value: str) -> Attribute:
 
 
 def novalidate(value: bool = True) -> Attribute:
-    return Attribute("novalidate", value)
+    return _constant("novalidate", value)
 
 
 def onabort(value: str) -> Attribute:
@@ -616,7 +641,7 @@ def onwheel(value: str) -> Attribute:
 
 
 def open(value: bool = True) -> Attribute:
-    return Attribute("open", value)
+    return _constant("open", value)
 
 
 def optimum(value: str) -> Attribute:
@@ -636,11 +661,11 @@ def placeholder(value: str) -> Attribute:
 
 
 def playsinline(value: bool = True) -> Attribute:
-    return Attribute("playsinline", value)
+    return _constant("playsinline", value)
 
 
 def popover(value: Literal["auto", "manual"]) -> Attribute:
-    return Attribute("popover", value)
+    return _constant("popover", value)
 
 
 def poster(value: str) -> Attribute:
@@ -648,11 +673,11 @@ def poster(value: str) -> Attribute:
 
 
 def preload(value: Literal["auto", "metadata", "none"]) -> Attribute:
-    return Attribute("preload", value)
+    return _constant("preload", value)
 
 
 def readonly(value: bool = True) -> Attribute:
-    return Attribute("readonly", value)
+    return _constant("readonly", value)
 
 
 def referrerpolicy(
@@ -667,7 +692,7 @@ def referrerpolicy(
         "unsafe-url",
     ],
 ) -> Attribute:
-    return Attribute("referrerpolicy", value)
+    return _constant("referrerpolicy", value)
 
 
 def rel(
@@ -698,15 +723,15 @@ def rel(
         "tag",
     ],
 ) -> Attribute:
-    return Attribute("rel", value)
+    return _constant("rel", value)
 
 
 def required(value: bool = True) -> Attribute:
-    return Attribute("required", value)
+    return _constant("required", value)
 
 
 def reversed(value: bool = True) -> Attribute:
-    return Attribute("reversed", value)
+    return _constant("reversed", value)
 
 
 def role(value: str) -> Attribute:
@@ -744,11 +769,11 @@ def scope(value: Literal["col", "row", "colgroup", "rowgroup"]) -> Attribute:
 
 
 def selected(value: bool = True) -> Attribute:
-    return Attribute("selected", value)
+    return _constant("selected", value)
 
 
 def shape(value: Literal["default", "rect", "circle", "poly"]) -> Attribute:
-    return Attribute("shape", value)
+    return _constant("shape", value)
 
 
 def size(value: int) -> Attribute:
@@ -768,7 +793,7 @@ def span(value: int) -> Attribute:
 
 
 def spellcheck(value: Literal["true", "false"] | bool = True) -> Attribute:
-    return Attribute("spellcheck", value)
+    return _constant("spellcheck", value)
 
 
 def src(value: str) -> Attribute:
@@ -814,7 +839,7 @@ def title(value: str) -> Attribute:
 
 
 def translate(value: Literal["yes", "no"]) -> Attribute:
-    return Attribute("translate", value)
+    return _constant("translate", value)
 
 
 def type_(
@@ -843,7 +868,7 @@ def type_(
         "week",
     ],
 ) -> Attribute:
-    return Attribute("type", value)
+    return _constant("type", value)
 
 
 def usemap(value: str) -> Attribute:
@@ -857,11 +882,11 @@ def value(value: str | int | float) -> Attribute:
 def virtualkeyboardpolicy(
     value: Literal["auto", "manual"] = "auto",
 ) -> Attribute:
-    return Attribute("virtualkeyboardpolicy", value)
+    return _constant("virtualkeyboardpolicy", value)
 
 
 def writingsuggestions(value: bool = True) -> Attribute:
-    return Attribute("writingsuggestions", value)
+    return _constant("writingsuggestions", value)
 
 
 def width(value: int | str) -> Attribute:
@@ -869,4 +894,4 @@ def width(value: int | str) -> Attribute:
 
 
 def wrap(value: Literal["hard", "soft", "off"]) -> Attribute:
-    return Attribute("wrap", value)
+    return _constant("wrap", value)
@@ -0,0 +1,51 @@
+from functools import lru_cache
+from typing import Any
+
+from markupsafe import Markup, escape
+
+# Larger payloads are escaped every time, so that the cache can't keep
+# big strings alive for the lifetime of the process
+_CACHED_MAX_LENGTH = 4096
+
+
+@lru_cache(maxsize=256)
+def _cached_escape(serialized: str) -> Markup:
+    # Identical payloads are only escaped once
+    return escape(serialized)
+
+
+def _escape(serialized: str) -> Markup:
+    if len(serialized) <= _CACHED_MAX_LENGTH:
+        return _cached_escape(serialized)
+    return escape(serialized)
+
+
+def _restore_json_value(serialized: str) -> "JsonValue":
+    value = str.__new__(JsonValue, serialized)
+    value.escaped = _escape(value)
+    return value
+
+
+class JsonValue(str):
+    """Attribute value serialized as compact JSON, with its escaped form
+    computed once at creation instead of on every render."""
+
+    # str subclasses can't define non-empty __slots__
+    escaped: Markup
+
+    def __new__(cls, obj: Any, **dumps_kwargs: Any) -> "JsonValue":
+        # Imported on first use only, json is not needed by most renders
+        from json import dumps
+
+        dumps_kwargs.setdefault("separators", (",", ":"))
+        dumps_kwargs.setdefault("ensure_ascii", False)
+        value = super().__new__(cls, dumps(obj, **dumps_kwargs))
+        value.escaped = _escape(value)
+        return value
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Already serialized, must not be serialized again when unpickled
+        return (_restore_json_value, (str(self),))
+
+    def __repr__(self) -> str:
+        return f"<markupy.JsonValue {str.__repr__(self)}>"
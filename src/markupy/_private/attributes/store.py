@@ -1,10 +1,14 @@
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from functools import lru_cache
+from typing import Any, TypeAlias
+
+from markupsafe import escape
 
 from markupy.exceptions import MarkupyError
 
-from .attribute import Attribute
-from .handlers import attribute_handlers
+from ..mode import is_strict_mode
+from .attribute import Attribute, is_valid_key, is_valid_value, render_attribute
+from .handlers import AttributeHandler, attribute_handlers
 
 
 @attribute_handlers.register
@@ -46,41 +50,138 @@ def python_to_html_key(key: str) -> str:
     return key.removesuffix("_").replace("_", "-")
 
 
-class AttributeStore(dict[str, Attribute]):
-    __slots__ = ()
+def _parse_selector(selector: str) -> tuple[str | None, list[str]]:
+    if selector := selector.replace(".", " ").strip():
+        if "#" in selector[1:]:
+            raise MarkupyError(
+                "Id must be defined only once and must be in first position of selector"
+            )
+        if selector.startswith("#"):
+            rawid, *classes = selector.split()
+            return rawid[1:] or None, classes
+        return None, selector.split()
+    return None, []
+
+
+_DEFAULT_CHAINS = ((), (default_attribute_handler,))
+
+
+def render_selector(selector: str) -> str | None:
+    """Attributes string for a selector used alone, without going through an
+    AttributeStore. Returns None when custom handlers are registered."""
+    for name in ("id", "class"):
+        if attribute_handlers.chain_for(name) not in _DEFAULT_CHAINS:
+            return None
+    # Selector attributes are never redefined: the default handler is a no-op
+    id, classes = _parse_selector(selector)
+    rendered: list[str] = []
+    if id:
+        rendered.append(f'id="{escape(id)}"')
+    if classes:
+        rendered.append(f'class="{escape(" ".join(classes))}"')
+    return " ".join(rendered)
+
+
+def _compiled_attribute(name: str, value: Attribute.Value) -> Attribute:
+    # Name and value have already been validated
+    attribute = Attribute.__new__(Attribute)
+    attribute._name = name
+    attribute._value = value
+    return attribute
+
+
+def _validate(name: str, value: Attribute.Value) -> None:
+    # Same checks as Attribute instantiation
+    if not is_valid_key(name):
+        raise MarkupyError(f"Attribute `{name!r}` has invalid name")
+    if not is_valid_value(value):
+        raise MarkupyError(f"Attribute `{name}` has invalid value {value!r}")
+
+
+class AttributeStore(dict[str, Attribute.Value]):
+    """Attribute values by name.
+
+    Attribute objects are only instantiated when custom handlers need them,
+    default handling (including class merging) is done in place.
+    """
 
-    def __setitem__(self, key: str, new: Attribute) -> None:
-        old = self[key] if key in self else None
-        for handler in attribute_handlers:
+    __slots__ = ("_classes",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Ordered and deduplicated class tokens, only used once classes are merged
+        self._classes: dict[str, None] | None = None
+
+    def _store(self, name: str, value: Attribute.Value) -> None:
+        if name == "class":
+            self._classes = None
+        super().__setitem__(name, value)
+
+    def value(self, name: str) -> Attribute.Value:
+        if name == "class" and self._classes is not None:
+            return " ".join(self._classes)
+        return self[name]
+
+    def pairs(self) -> Iterator[tuple[str, Attribute.Value]]:
+        for name in self:
+            yield name, self.value(name)
+
+    def _set(self, name: str, value: Attribute.Value) -> None:
+        # Name and value must have been validated
+        chain = attribute_handlers.chain_for(name)
+        if not chain:
+            self._store(name, value)
+        elif len(chain) == 1 and chain[0] is default_attribute_handler:
+            self._set_default(name, value)
+        else:
+            self._set_handlers(name, value, chain)
+
+    def _set_default(self, name: str, value: Attribute.Value) -> None:
+        # Inlined equivalent of default_attribute_handler
+        if name == "class" and self._classes is not None:
+            if value is not None:
+                self._classes.update(dict.fromkeys(str(value).split()))
+            return
+        old = self.get(name)
+        if old is None or old == value:
+            self._store(name, value)
+        elif value is None:
+            pass
+        elif name == "class":
+            # Class tokens are merged in place, without re-splitting the
+            # whole merged string on every addition
+            self._classes = dict.fromkeys(str(old).split())
+            self._classes.update(dict.fromkeys(str(value).split()))
+        else:
+            raise MarkupyError(f"Invalid attempt to redefine attribute `{name}`")
+
+    def _set_handlers(
+        self, name: str, value: Attribute.Value, chain: tuple[AttributeHandler, ...]
+    ) -> None:
+        old = _compiled_attribute(name, self.value(name)) if name in self else None
+        new = _compiled_attribute(name, value)
+        for handler in chain:
             if attribute := handler(old, new):
                 if attribute is new:
                     # stop the handler chain
-                    new = attribute
                     break
                 else:
                     # restart a handler chain (beware of infinite loops!)
                     return self.add(attribute)
 
-        super().__setitem__(key, new)
+        self._store(name, new.value)
 
     def __str__(self) -> str:
-        return " ".join(filter(None, map(str, self.values())))
+        return " ".join(
+            filter(None, (render_attribute(*item) for item in self.pairs()))
+        )
 
     def add_selector(self, selector: str) -> None:
-        if selector := selector.replace(".", " ").strip():
-            if "#" in selector[1:]:
-                raise MarkupyError(
-                    "Id must be defined only once and must be in first position of selector"
-                )
-            if selector.startswith("#"):
-                rawid, *classes = selector.split()
-                if id := rawid[1:]:
-                    self.add(Attribute("id", id))
-            else:
-                classes = selector.split()
-
-            if classes:
-                self.add(Attribute("class", " ".join(classes)))
+        id, classes = _parse_selector(selector)
+        if id:
+            self._set("id", id)
+        if classes:
+            self._set("class", " ".join(classes))
 
     def add_dict(
         self,
@@ -88,13 +189,131 @@ class AttributeStore(dict[str, Attribute]):
         *,
         rewrite_keys: bool = False,
     ) -> None:
+        if rewrite_keys and not is_strict_mode():
+            # Names rewritten from python identifiers cannot contain chars that
+            # would need escaping, name validation is only done in strict mode
+            for key, value in dct.items():
+                name = python_to_html_key(key)
+                if not is_valid_value(value):
+                    raise MarkupyError(
+                        f"Attribute `{name}` has invalid value {value!r}"
+                    )
+                self._set(name, value)
+            return
         for key, value in dct.items():
             name = python_to_html_key(key) if rewrite_keys else key
-            self.add(Attribute(name, value))
+            _validate(name, value)
+            self._set(name, value)
+
+    def add_args(
+        self, args: tuple[Any, ...], kwargs: dict[str, Any], *, owner: object
+    ) -> None:
+        for arg in args:
+            if len(self) == 0 and isinstance(arg, str):
+                self.add_selector(arg)
+            elif arg is None:
+                pass
+            elif isinstance(arg, Attributes):
+                self.add_bundle(arg)
+            elif isinstance(arg, Mapping):
+                self.add_dict(arg)  # type:ignore[unused-ignore]
+            elif isinstance(arg, tuple):
+                self.add_tuple(arg)  # type:ignore[unused-ignore]
+            elif isinstance(arg, Attribute):
+                self.add(arg)
+            else:
+                raise MarkupyError(f"Invalid argument {arg!r} for {owner!r}")
+        if kwargs:
+            self.add_dict(kwargs, rewrite_keys=True)
+
+    def add_bundle(self, bundle: "Attributes") -> None:
+        for name, value in bundle:
+            if name in self:
+                # Only conflicting attributes need to go through handlers, from
+                # their values as provided to the bundle (processed values
+                # would go through handlers twice)
+                for raw_name, raw_value in bundle._get_compiled()[4]:
+                    if raw_name == name:
+                        self._set(raw_name, raw_value)
+            else:
+                # Handlers have already been applied when compiling the bundle
+                self._store(name, value)
 
     def add_tuple(self, attr: tuple[Attribute.Name, Attribute.Value]) -> None:
         name, value = attr
-        self.add(Attribute(name, value))
+        _validate(name, value)
+        self._set(name, value)
 
     def add(self, attr: Attribute) -> None:
-        self[attr.name] = attr
+        self._set(attr.name, attr.value)
+
+
+class _RawAttributes(AttributeStore):
+    """Validated attribute values, in the order they would be set, before
+    they go through handlers."""
+
+    __slots__ = ("raw",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.raw: list[tuple[str, Attribute.Value]] = []
+
+    def _set(self, name: str, value: Attribute.Value) -> None:
+        self.raw.append((name, value))
+
+    def add_bundle(self, bundle: "Attributes") -> None:
+        self.raw.extend(bundle._get_compiled()[4])
+
+
+# Handlers chain and scope used for compilation, processed attribute values,
+# rendered attributes and values before handlers
+_CompiledBundle: TypeAlias = tuple[
+    Any,
+    Any,
+    tuple[tuple[str, Attribute.Value], ...],
+    str,
+    tuple[tuple[str, Attribute.Value], ...],
+]
+
+
+class Attributes:
+    """Frozen bundle of attributes, validated, processed by handlers and escaped once.
+
+    Bundles can be passed to elements like any other attribute argument, which
+    is useful to share a common set of attributes ("traits") between elements.
+    """
+
+    __slots__ = ("_args", "_compiled", "_kwargs")
+
+    def __init__(self, *args: Any, **kwargs: Attribute.Value) -> None:
+        self._args = args
+        self._kwargs = kwargs
+        self._compiled = self._compile()
+
+    def _compile(self) -> _CompiledBundle:
+        chain, scope = attribute_handlers._chain, attribute_handlers.scope_key()
+        attrs = AttributeStore()
+        attrs.add_args(self._args, self._kwargs, owner=self)
+        # Arguments are valid, record them before any handler processing
+        raw = _RawAttributes()
+        raw.add_args(self._args, self._kwargs, owner=self)
+        return chain, scope, tuple(attrs.pairs()), str(attrs), tuple(raw.raw)
+
+    def _get_compiled(self) -> _CompiledBundle:
+        compiled = self._compiled
+        if (
+            compiled[0] is not attribute_handlers._chain
+            or compiled[1] != attribute_handlers.scope_key()
+        ):
+            # Handlers have changed since the bundle was compiled
+            compiled = self._compiled = self._compile()
+        return compiled
+
+    def __iter__(self) -> Iterator[tuple[str, Attribute.Value]]:
+        return iter(self._get_compiled()[2])
+
+    def __str__(self) -> str:
+        return self._get_compiled()[3]
+
+    def __repr__(self) -> str:
+        return "<markupy.Attributes>"
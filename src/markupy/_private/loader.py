@@ -0,0 +1,183 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Mapping
+from inspect import iscoroutine
+from threading import Event, Lock
+from typing import Generic, TypeAlias, TypeVar
+
+from markupy.exceptions import MarkupyError
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+BatchLoadFunction: TypeAlias = Callable[
+    [list[K]], Mapping[K, V] | Awaitable[Mapping[K, V]]
+]
+
+
+class Deferred(Generic[K, V]):
+    __slots__ = ("_key", "_loader")
+
+    def __init__(self, loader: "Loader[K, V]", key: K) -> None:
+        self._loader = loader
+        self._key = key
+
+    @property
+    def key(self) -> K:
+        return self._key
+
+    def get(self) -> V:
+        return self._loader._get(self._key)
+
+    def __repr__(self) -> str:
+        return f"<markupy.Deferred {self._key!r}>"
+
+
+class Loader(Generic[K, V]):
+    """Request-scoped batched data loading.
+
+    Keys are registered with `load()` (typically when components are instantiated)
+    and only fetched when one of the returned deferred values is first read.
+    At that point, all pending keys are fetched with a single call to `batch_load`.
+    """
+
+    __slots__ = ("_batch_load", "_inflight", "_lock", "_loop", "_pending", "_values")
+
+    def __init__(
+        self,
+        batch_load: BatchLoadFunction[K, V],
+        *,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> None:
+        self._batch_load = batch_load
+        # Event loop running async batch functions when called during rendering
+        # (defaults to the loop the loader is created from, if any)
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+        self._loop = loop
+        # Components sharing a loader may be rendered from multiple threads,
+        # the lock is never held while fetching values
+        self._lock = Lock()
+        self._pending: dict[K, None] = {}
+        # Keys being fetched, with the event set once their batch is done
+        self._inflight: dict[K, Event] = {}
+        self._values: dict[K, V] = {}
+
+    def load(self, key: K) -> Deferred[K, V]:
+        with self._lock:
+            if key not in self._values and key not in self._inflight:
+                self._pending[key] = None
+        return Deferred(self, key)
+
+    def load_many(self, keys: Iterable[K]) -> list[Deferred[K, V]]:
+        return [self.load(key) for key in keys]
+
+    def prime(self, key: K, value: V) -> None:
+        """Provide a value upfront so that it won't be part of a batch."""
+        with self._lock:
+            self._pending.pop(key, None)
+            self._values[key] = value
+
+    def _take_pending(self) -> tuple[list[K], Event]:
+        event = Event()
+        with self._lock:
+            keys = list(self._pending)
+            self._pending.clear()
+            for key in keys:
+                self._inflight[key] = event
+        return keys, event
+
+    def _done(self, keys: list[K], event: Event, values: Mapping[K, V] | None) -> None:
+        with self._lock:
+            for key in keys:
+                del self._inflight[key]
+                if values is None:
+                    # Failed batch: keys can be fetched again
+                    self._pending[key] = None
+                elif key in values:
+                    self._values[key] = values[key]
+        event.set()
+
+    def _wait(self, awaitable: Awaitable[Mapping[K, V]]) -> Mapping[K, V]:
+        loop = self._loop
+        if loop is None or not loop.is_running():
+            raise MarkupyError(
+                "Loader has an async batch function and no running event loop, `await loader.dispatch_async()` must be called before rendering"
+            )
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+        if current is loop:
+            # Waiting from the loop thread would block the loop forever
+            raise MarkupyError(
+                "Loader has an async batch function, views must be rendered with `iter_async()` or `await loader.dispatch_async()` must be called before rendering"
+            )
+
+        async def wait() -> Mapping[K, V]:
+            return await awaitable
+
+        return asyncio.run_coroutine_threadsafe(wait(), loop).result()
+
+    def dispatch(self) -> None:
+        """Fetch all pending keys with a single call to the batch function.
+
+        Async batch functions are run in the event loop of the loader, which
+        requires rendering to happen in another thread (such as with `iter_async()`).
+        """
+        keys, event = self._take_pending()
+        if not keys:
+            return
+        values: Mapping[K, V] | None = None
+        try:
+            result = self._batch_load(keys)
+            if isinstance(result, Mapping):
+                values = result
+            else:
+                try:
+                    values = self._wait(result)
+                except MarkupyError:
+                    if iscoroutine(result):
+                        # Avoid a "coroutine was never awaited" warning
+                        result.close()
+                    raise
+        finally:
+            self._done(keys, event, values)
+
+    async def dispatch_async(self) -> None:
+        """Same as dispatch(), but also supports async batch functions."""
+        keys, event = self._take_pending()
+        if not keys:
+            return
+        values: Mapping[K, V] | None = None
+        try:
+            result = self._batch_load(keys)
+            values = result if isinstance(result, Mapping) else await result
+        finally:
+            self._done(keys, event, values)
+
+    def _get(self, key: K) -> V:
+        event: Event | None = None
+        with self._lock:
+            ready = key in self._values
+            if not ready and (event := self._inflight.get(key)) is None:
+                self._pending[key] = None
+        if not ready:
+            if event is None:
+                self.dispatch()
+                # The key may have been taken by a batch started concurrently
+                event = self._inflight.get(key)
+            if event is not None:
+                # Wait for the batch in progress instead of triggering a new one
+                event.wait()
+        try:
+            return self._values[key]
+        except KeyError:
+            raise MarkupyError(
+                f"Batch function of {self!r} did not return a value for key {key!r}"
+            ) from None
+
+    def __repr__(self) -> str:
+        return "<markupy.Loader>"
@@ -0,0 +1,34 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Process-wide default, used by threads and contexts without any explicit mode
+_default_strict: bool = True
+_strict: ContextVar[bool | None] = ContextVar("markupy_strict_mode", default=None)
+
+
+def is_strict_mode() -> bool:
+    if (strict := _strict.get()) is None:
+        return _default_strict
+    return strict
+
+
+def set_strict_mode(enabled: bool) -> None:
+    """Set the default mode for the whole process.
+
+    Strict mode (the default) runs checks meant to catch developer mistakes,
+    such as uncalled functions passed as children. Disabling it in production
+    skips these checks, output and escaping remain identical.
+    """
+    global _default_strict
+    _default_strict = enabled
+
+
+@contextmanager
+def strict_mode(enabled: bool) -> Iterator[None]:
+    """Override the default mode for the current context only."""
+    token = _strict.set(enabled)
+    try:
+        yield
+    finally:
+        _strict.reset(token)
@@ -1,12 +1,13 @@
-from .component import Component
-from .element import Element, get_element
+from .component import Component, component_slots
 from .fragment import Fragment
 from .view import View
 
+# Other views (elements, compact, concurrent, streaming...) are imported from
+# their own module when needed, to keep `import markupy` fast
+
 __all__ = [
     "Component",
-    "Element",
     "Fragment",
     "View",
-    "get_element",
+    "component_slots",
 ]
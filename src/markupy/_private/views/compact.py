@@ -0,0 +1,108 @@
+from array import array
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from markupsafe import escape
+from typing_extensions import Self, override
+
+from markupy.exceptions import MarkupyError
+
+from ..mode import is_strict_mode
+from .element import Element, HtmlElement, VoidElement
+from .view import View
+
+
+class CompactView(View):
+    """Pre-rendered tree stored as a table of unique strings and an array of
+    references to this table, in document order."""
+
+    __slots__ = ("_refs", "_strings")
+
+    def __init__(self, strings: tuple[str, ...], refs: "array[int]") -> None:
+        super().__init__()
+        self._strings = strings
+        self._refs = refs
+
+    @override
+    def __iter__(self) -> Iterator[str]:
+        return map(self._strings.__getitem__, self._refs)
+
+    @override
+    def __getitem__(self, content: Any) -> Self:
+        raise MarkupyError(f"{self!r} cannot contain children")
+
+    @override
+    def __repr__(self) -> str:
+        return "<markupy.CompactView>"
+
+
+class CompactBuilder:
+    """Builds a CompactView without instantiating any element or child tuple."""
+
+    __slots__ = ("_index", "_refs", "_stack", "_strings")
+
+    def __init__(self) -> None:
+        self._reset()
+        # Closing tag reference and safe flag of currently opened elements
+        self._stack: list[tuple[int, bool]] = []
+
+    def _reset(self) -> None:
+        self._strings: list[str] = []
+        self._index: dict[str, int] = {}
+        self._refs: array[int] = array("I")
+
+    def _ref(self, value: str) -> int:
+        if (ref := self._index.get(value)) is None:
+            ref = self._index[value] = len(self._strings)
+            self._strings.append(value)
+        return ref
+
+    def _push(self, value: str) -> None:
+        self._refs.append(self._ref(value))
+
+    def open(self, element: Element) -> None:
+        if isinstance(element, VoidElement):
+            raise MarkupyError(
+                f"Void element {element!r} cannot be opened, use `append()` instead"
+            )
+        if element._children:
+            raise MarkupyError(f"Element {element!r} must not have children")
+        if isinstance(element, HtmlElement):
+            self._push("<!doctype html>")
+        self._push(element._tag_opening())
+        self._stack.append((self._ref(element._tag_closing()), element._safe))
+
+    def close(self) -> None:
+        if not self._stack:
+            raise MarkupyError("No element left to close")
+        closing, _ = self._stack.pop()
+        self._refs.append(closing)
+
+    @contextmanager
+    def element(self, element: Element) -> Iterator[None]:
+        self.open(element)
+        yield
+        self.close()
+
+    def append(self, node: Any) -> None:
+        """Append any kind of child node (text, views, iterables...)."""
+        safe = self._stack[-1][1] if self._stack else False
+        if isinstance(node, str):
+            # Fast path for the most common case
+            if node:
+                self._push(node if safe else escape(node))
+            return
+        for child in View(safe=safe)._iter_node(node, is_strict_mode()):
+            if isinstance(child, View):
+                for chunk in child:
+                    self._push(chunk)
+            else:
+                self._push(child)
+
+    def build(self) -> CompactView:
+        if self._stack:
+            raise MarkupyError(f"{len(self._stack)} element(s) have not been closed")
+        view = CompactView(tuple(self._strings), self._refs)
+        self._reset()
+        return view
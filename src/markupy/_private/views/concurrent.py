@@ -0,0 +1,212 @@
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextvars import copy_context
+from itertools import chain, islice
+from multiprocessing.context import BaseContext
+from os import cpu_count
+from typing import Any, Generic, TypeVar
+
+from typing_extensions import Self, override
+
+from markupy.exceptions import MarkupyError
+
+from ..attributes.handlers import attribute_handlers
+from ..mode import is_strict_mode, strict_mode
+from .fragment import Fragment
+from .view import ChildrenType, ChildType, View, _flatten, compact_pickling
+
+T = TypeVar("T")
+
+
+def _restore_concurrent_fragment(
+    max_workers: int | None, shared: bool, children: ChildrenType
+) -> "ConcurrentFragment":
+    fragment = ConcurrentFragment(max_workers=max_workers, shared=shared)
+    fragment._children = children
+    return fragment
+
+
+def _render(node: ChildType) -> str:
+    if isinstance(node, View):
+        return "".join(node)
+    return node
+
+
+class ConcurrentFragment(Fragment):
+    __slots__ = ("_max_workers",)
+
+    def __init__(self, *, max_workers: int | None = None, shared: bool = True) -> None:
+        if max_workers is not None and max_workers < 1:
+            raise MarkupyError(f"Invalid value {max_workers!r} for `max_workers`")
+        super().__init__(shared=shared)
+        self._max_workers = max_workers
+
+    @override
+    def __copy__(self) -> Self:
+        return type(self)(max_workers=self._max_workers, shared=False)
+
+    @override
+    def __call__(self, *, max_workers: int | None = None) -> Self:
+        if self._children:
+            raise MarkupyError(
+                f"Illegal attempt to configure {self!r} after defining its children"
+            )
+        return type(self)(max_workers=max_workers)
+
+    @override
+    def __repr__(self) -> str:
+        return "<markupy.Concurrent>"
+
+    @override
+    def _compact_reduce(self) -> str | tuple[Any, ...]:
+        return (
+            _restore_concurrent_fragment,
+            (self._max_workers, self._shared, _flatten(self._children)),
+        )
+
+    @override
+    def __iter__(self) -> Iterator[str]:
+        if sum(isinstance(node, View) for node in self._children) < 2:
+            # Nothing to parallelize
+            yield from super().__iter__()
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="markupy"
+        )
+        try:
+            # Each child is rendered in a copy of the current context so that
+            # context variables are visible from worker threads
+            futures: list[Future[str]] = [
+                executor.submit(copy_context().run, _render, node)
+                for node in self._children
+            ]
+            for future in futures:
+                # Results are emitted in document order,
+                # errors are re-raised in the calling thread
+                yield future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+compact_pickling.add(ConcurrentFragment)
+
+
+def _render_shard(render_item: Callable[[T], Any], shard: list[T], strict: bool) -> str:
+    # Runs in a worker process: only the item data and the (picklable) render
+    # function are transferred, the resulting view never leaves the worker
+    with strict_mode(strict):
+        return "".join(View()[(render_item(item) for item in shard)])
+
+
+class ShardedView(View, Generic[T]):
+    """Items rendered by shards in a pool of processes, streamed back in order.
+
+    Worker processes that are not forked don't inherit handlers registered at
+    runtime: `initializer` is called in each of them to reproduce this setup.
+    A long-lived `executor` can also be provided (and is then left running),
+    strict mode is passed along with each shard.
+    """
+
+    __slots__ = (
+        "_executor",
+        "_initargs",
+        "_initializer",
+        "_items",
+        "_max_workers",
+        "_mp_context",
+        "_render_item",
+        "_shard_size",
+    )
+
+    def __init__(
+        self,
+        render_item: Callable[[T], Any],
+        items: Iterable[T],
+        *,
+        shard_size: int = 1000,
+        max_workers: int | None = None,
+        executor: Executor | None = None,
+        mp_context: BaseContext | None = None,
+        initializer: Callable[..., object] | None = None,
+        initargs: tuple[Any, ...] = (),
+    ) -> None:
+        if shard_size < 1:
+            raise MarkupyError(f"Invalid value {shard_size!r} for `shard_size`")
+        if max_workers is not None and max_workers < 1:
+            raise MarkupyError(f"Invalid value {max_workers!r} for `max_workers`")
+        if executor is not None and (mp_context or initializer):
+            raise MarkupyError(
+                "`mp_context` and `initializer` must be set on the provided `executor`"
+            )
+        super().__init__()
+        self._render_item = render_item
+        # Like generator children, items are consumed once so that the view
+        # can be rendered multiple times
+        self._items: Sequence[T] = (
+            items if isinstance(items, Sequence) else tuple(items)
+        )
+        self._shard_size = shard_size
+        self._max_workers = max_workers
+        self._executor = executor
+        self._mp_context = mp_context
+        self._initializer = initializer
+        self._initargs = initargs
+
+    @override
+    def __getitem__(self, content: Any) -> Self:
+        raise MarkupyError(f"{self!r} cannot contain children")
+
+    @override
+    def __repr__(self) -> str:
+        return "<markupy.Sharded>"
+
+    def _shards(self) -> Iterator[list[T]]:
+        items = iter(self._items)
+        while shard := list(islice(items, self._shard_size)):
+            yield shard
+
+    @override
+    def __iter__(self) -> Iterator[str]:
+        if attribute_handlers.scope_key():
+            # Overlays are bound to the current context, they can't be
+            # reproduced in worker processes
+            raise MarkupyError(
+                f"{self!r} cannot be rendered while attribute handler overlays are active"
+            )
+        strict = is_strict_mode()
+        shards = self._shards()
+        first, second = next(shards, None), next(shards, None)
+        if first is None:
+            return
+        elif second is None and self._executor is None:
+            # Not worth spawning processes for a single shard
+            yield _render_shard(self._render_item, first, strict)
+            return
+
+        max_workers = self._max_workers or cpu_count() or 1
+        executor = self._executor or ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=self._mp_context,
+            initializer=self._initializer,
+            initargs=self._initargs,
+        )
+        try:
+            # Only keep a limited number of shards in flight so that
+            # rendered output can be streamed with a bounded memory usage
+            pending: deque[Future[str]] = deque()
+            for shard in chain((first,), () if second is None else (second,), shards):
+                pending.append(
+                    executor.submit(_render_shard, self._render_item, shard, strict)
+                )
+                if len(pending) >= 2 * max_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            if executor is not self._executor:
+                executor.shutdown(wait=True, cancel_futures=True)
+            else:
+                for future in pending:
+                    future.cancel()
@@ -1,23 +1,46 @@
-from collections.abc import Iterator, Mapping
-from functools import lru_cache
+from collections.abc import Iterable, Iterator, Mapping
 from re import match as re_fullmatch
 from re import sub as re_sub
-from typing import Any, TypeAlias, overload
+from typing import Any, TypeAlias, TypeVar, overload
 
 from typing_extensions import Self, override
 
 from markupy.exceptions import MarkupyError
 
-from ..attributes import Attribute, AttributeStore
+from ..attributes import Attribute, Attributes, AttributeStore
+from ..attributes.cache import attribute_cache, signature_key
+from ..attributes.handlers import attribute_handlers
+from ..attributes.store import render_selector
 from .fragment import Fragment
+from .view import ChildrenType, _clone, _flatten, compact_pickling
 
 AttributeArgs: TypeAlias = (
     Mapping[Attribute.Name, Attribute.Value]
     | tuple[Attribute.Name, Attribute.Value]
     | Attribute
+    | Attributes
     | None
 )
 
+E = TypeVar("E", bound="Element")
+
+
+def _restore_element(
+    cls: type[E],
+    name: str,
+    safe: bool,
+    shared: bool,
+    attributes: str | None,
+    children: ChildrenType,
+) -> E:
+    element = cls.__new__(cls)
+    element._name = name
+    element._safe = safe
+    element._shared = shared
+    element._attributes = attributes
+    element._children = children
+    return element
+
 
 class Element(Fragment):
     __slots__ = ("_attributes", "_name")
@@ -28,7 +51,35 @@ class Element(Fragment):
         self._attributes: str | None = None
 
     def __copy__(self) -> Self:
-        return type(self)(self.name, shared=False)
+        # As when copies were built by __init__, only safe element classes
+        # produce safe copies: a `safe=True` argument is not carried over
+        safe = isinstance(self, SafeElement)
+        # Attributes are only set on shared elements when they are prototypes
+        if type(self) in _builtin_elements:
+            # Slot-level cloning, skipping the whole __init__ chain
+            return _restore_element(
+                type(self), self._name, safe, False, self._attributes, ()
+            )
+        # Subclasses may define slots of their own
+        element = _clone(self)
+        element._safe = safe
+        element._shared = False
+        element._children = ()
+        return element
+
+    def prototype(self) -> Self:
+        """Return a shared copy of this element, with its attributes already computed.
+
+        Like elements imported from `markupy.elements`, a prototype is never modified:
+        assigning children returns a new element, cheaply cloned from the prototype.
+        """
+        if self._children:
+            raise MarkupyError(f"Cannot make a prototype of {self!r} with children")
+        if self._shared:
+            return self
+        element = self.__copy__()
+        element._shared = True
+        return element
 
     @property
     def name(self) -> str:
@@ -50,6 +101,28 @@ class Element(Fragment):
     def __repr__(self) -> str:
         return f"<markupy.{type(self).__name__}.{self._name}>"
 
+    def _compact_reduce(self) -> str | tuple[Any, ...]:
+        if self._shared and self._attributes is None and not self._children:
+            # Shared elements are pickled by name to preserve singletons
+            name = "".join(word.capitalize() for word in self._name.split("-"))
+            try:
+                if get_element(name) is self:
+                    return (get_element, (name,))
+            except (AttributeError, MarkupyError):
+                pass
+        return (
+            _restore_element,
+            (
+                type(self),
+                self._name,
+                self._safe,
+                self._shared,
+                # Attributes are kept pre-rendered
+                self._attributes,
+                _flatten(self._children),
+            ),
+        )
+
     # Use call syntax () to define attributes
     @overload
     def __call__(self, *args: AttributeArgs, **kwargs: Attribute.Value) -> Self: ...
@@ -71,30 +144,40 @@ class Element(Fragment):
                 f"Illegal attempt to define attributes after children for element {self!r}"
             )
 
-        attrs = AttributeStore()
-        for arg in args:
-            if len(attrs) == 0 and isinstance(arg, str):
-                attrs.add_selector(arg)
-            elif arg is None:
-                pass
-            elif isinstance(arg, Mapping):
-                attrs.add_dict(arg)  # type:ignore[unused-ignore]
-            elif isinstance(arg, tuple):
-                attrs.add_tuple(arg)  # type:ignore[unused-ignore]
-            elif isinstance(arg, Attribute):
-                attrs.add(arg)
-            else:
-                raise MarkupyError(f"Invalid argument {arg!r} for element {self!r}")
-        if kwargs:
-            attrs.add_dict(kwargs, rewrite_keys=True)
-
-        if attributes := str(attrs):
+        if not args and not kwargs:
+            return self
+
+        # Identical arguments always result in the same attributes
+        chain = attribute_handlers._chain
+        if attribute_cache.enabled and (key := signature_key(args, kwargs)) is not None:
+            if (attributes := attribute_cache.get(key)) is None:
+                attributes = self._render_attributes(args, kwargs)
+                attribute_cache.set(key, attributes, chain)
+        else:
+            attributes = self._render_attributes(args, kwargs)
+
+        if attributes:
             el = self._get_instance()
             el._attributes = attributes
             return el
 
         return self
 
+    def _render_attributes(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+        if not kwargs and len(args) == 1:
+            if isinstance(arg := args[0], str):
+                # Fast path for the most common case, avoids instantiating
+                # the attribute store when no custom handler needs to run
+                if (attributes := render_selector(arg)) is not None:
+                    return attributes
+            elif isinstance(arg, Attributes):
+                # Bundles applied alone are already rendered
+                return str(arg)
+
+        attrs = AttributeStore()
+        attrs.add_args(args, kwargs, owner=self)
+        return str(attrs)
+
 
 class HtmlElement(Element):
     __slots__ = ()
@@ -161,9 +244,35 @@ SPECIAL_ELEMENTS: dict[str, type[Element]] = {
     "html": HtmlElement,
 }
 
+_builtin_elements: frozenset[type[Element]] = frozenset(
+    (Element, *SPECIAL_ELEMENTS.values())
+)
+compact_pickling.update(_builtin_elements)
+
+
+# Unbounded: the number of distinct element names used by an app is finite
+_elements: dict[str, Element] = {}
+
+
+def preload_elements(names: Iterable[str]) -> dict[str, Element]:
+    """Instantiate standard elements upfront, bypassing name validation.
+
+    Names must be valid single word element names (such as `Div` or `H1`).
+    """
+    for name in names:
+        if name not in _elements:
+            html_name = name.lower()
+            cls = SPECIAL_ELEMENTS.get(html_name, Element)
+            _elements.setdefault(name, cls(html_name))
+    return {name: _elements[name] for name in names}
+
 
-@lru_cache(maxsize=300)
 def get_element(name: str) -> Element:
+    try:
+        return _elements[name]
+    except KeyError:
+        pass
+
     if name == "_":
         # Special exception for CommentElement
         html_name = "_"
@@ -180,4 +289,6 @@ def get_element(name: str) -> Element:
         html_name = "-".join(words).lower()
 
     cls = SPECIAL_ELEMENTS.get(html_name, Element)
-    return cls(html_name)
+    # setdefault is atomic: if several threads race to create the same element,
+    # they all get the same shared instance
+    return _elements.setdefault(name, cls(html_name))
@@ -1,9 +1,20 @@
-from copy import copy
-from typing import final
+from typing import Any, TypeVar, final
 
 from typing_extensions import Self
 
-from .view import View
+from .view import ChildrenType, View, _clone, _flatten, compact_pickling
+
+F = TypeVar("F", bound="Fragment")
+
+
+def _restore_fragment(
+    cls: type[F], safe: bool, shared: bool, children: ChildrenType
+) -> F:
+    fragment = cls.__new__(cls)
+    fragment._safe = safe
+    fragment._shared = shared
+    fragment._children = children
+    return fragment
 
 
 class Fragment(View):
@@ -14,21 +25,40 @@ class Fragment(View):
         self._shared: bool = shared
 
     def __copy__(self) -> Self:
-        return type(self)(shared=False)
+        # As when copies were built by __init__, a `safe=True` argument is not
+        # carried over
+        if type(self) is Fragment:
+            # Slot-level cloning, skipping the whole __init__ chain
+            return _restore_fragment(type(self), False, False, ())
+        # Subclasses may define slots of their own
+        fragment = _clone(self)
+        fragment._safe = False
+        fragment._shared = False
+        fragment._children = ()
+        return fragment
 
     def __call__(self) -> Self:
         return self
 
+    def _compact_reduce(self) -> str | tuple[Any, ...]:
+        return (
+            _restore_fragment,
+            (type(self), self._safe, self._shared, _flatten(self._children)),
+        )
+
     @final
     def _get_instance(self: Self) -> Self:
         # When imported, elements are loaded from a shared instance
         # Make sure we re-instantiate them on setting attributes/children
         # to avoid sharing attributes/children between multiple instances
         if self._shared:
-            return copy(self)
+            return self.__copy__()
         return self
 
     # Avoid having Django "call" a markupy fragment (or element) that is injected into a template.
     # Setting do_not_call_in_templates will prevent Django from doing an extra call:
     # https://docs.djangoproject.com/en/5.0/ref/templates/api/#variables-and-lookups
     do_not_call_in_templates = True
+
+
+compact_pickling.add(Fragment)
@@ -0,0 +1,88 @@
+from collections.abc import Hashable
+from typing import TypeVar
+
+from .element import (
+    CommentElement,
+    Element,
+    HtmlElement,
+    SafeElement,
+    VoidElement,
+)
+from .fragment import Fragment
+from .view import ChildType, View
+
+V = TypeVar("V", bound=View)
+
+# Views whose output only depends on their type, slots and children.
+# Other views (components, user defined subclasses...) are left untouched.
+_STRUCTURAL_TYPES: set[type[View]] = {
+    View,
+    Fragment,
+    Element,
+    HtmlElement,
+    VoidElement,
+    CommentElement,
+    SafeElement,
+}
+
+
+class Interner:
+    """Deduplicates identical finalized subtrees and attribute strings.
+
+    Interning a view returns a canonical instance rendering the same output: the
+    first view interned with a given structure, whose descendants and strings are
+    themselves canonical. Canonical instances are kept alive as long as the
+    interner, so its lifetime defines the scope of deduplication.
+    """
+
+    __slots__ = ("_strings", "_views")
+
+    def __init__(self) -> None:
+        self._strings: dict[str, str] = {}
+        self._views: dict[Hashable, View] = {}
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+    def clear(self) -> None:
+        self._strings.clear()
+        self._views.clear()
+
+    def intern_str(self, value: str) -> str:
+        return self._strings.setdefault(value, value)
+
+    def _intern_node(self, node: ChildType) -> ChildType:
+        if isinstance(node, View):
+            return self(node)
+        return self.intern_str(node)
+
+    def __call__(self, view: V) -> V:
+        if type(view) not in _STRUCTURAL_TYPES:
+            return view
+
+        attributes: str | None = None
+        if isinstance(view, Fragment):
+            if view._shared:
+                # Singletons from markupy.elements are already unique
+                return view
+            if isinstance(view, Element) and view._attributes is not None:
+                attributes = self.intern_str(view._attributes)
+
+        children = tuple(self._intern_node(node) for node in view._children)
+        key = (
+            type(view),
+            view._safe,
+            view._name if isinstance(view, Element) else None,
+            attributes,
+            # Interned children are canonical: they can be compared by identity
+            tuple(id(node) if isinstance(node, View) else node for node in children),
+        )
+        if (canonical := self._views.get(key)) is not None:
+            return canonical  # type: ignore[return-value]
+
+        # Finalized views are not supposed to change anymore, replacing their
+        # children/attributes with equal canonical ones does not affect output
+        view._children = children
+        if isinstance(view, Element):
+            view._attributes = attributes
+        return self._views.setdefault(key, view)  # type: ignore[return-value]
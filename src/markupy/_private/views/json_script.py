@@ -0,0 +1,68 @@
+from collections.abc import Iterator
+from json import JSONEncoder
+from typing import Any
+
+from typing_extensions import Self, override
+
+from markupy.exceptions import MarkupyError
+
+from .view import View
+
+# These chars can only appear within JSON strings, where unicode escapes are
+# equivalent: prevents breaking out of the script element (`</script>`, `<!--`)
+# and line terminators that are invalid in JavaScript before ES2019
+_SCRIPT_SAFE = str.maketrans(
+    {
+        "<": "\\u003c",
+        ">": "\\u003e",
+        "&": "\\u0026",
+        "\u2028": "\\u2028",
+        "\u2029": "\\u2029",
+    }
+)
+
+
+class JsonScript(View):
+    """JSON data island, to be used as the content of a script element.
+
+    The object is serialized incrementally and rendered by chunks of about
+    `buffer_size` characters, so that the whole JSON string never needs to
+    exist in memory.
+    """
+
+    __slots__ = ("_buffer_size", "_encoder", "_obj")
+
+    def __init__(
+        self, obj: Any, *, buffer_size: int = 16384, **encoder_kwargs: Any
+    ) -> None:
+        if buffer_size < 1:
+            raise MarkupyError(f"Invalid value {buffer_size!r} for `buffer_size`")
+        super().__init__()
+        encoder_kwargs.setdefault("separators", (",", ":"))
+        encoder_kwargs.setdefault("ensure_ascii", False)
+        self._obj = obj
+        self._buffer_size = buffer_size
+        self._encoder = JSONEncoder(**encoder_kwargs)
+
+    @override
+    def __iter__(self) -> Iterator[str]:
+        buffer: list[str] = []
+        size = 0
+        for chunk in self._encoder.iterencode(self._obj):
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= self._buffer_size:
+                # Escaping is done char by char, it can be applied on any chunk
+                yield "".join(buffer).translate(_SCRIPT_SAFE)
+                buffer.clear()
+                size = 0
+        if buffer:
+            yield "".join(buffer).translate(_SCRIPT_SAFE)
+
+    @override
+    def __getitem__(self, content: Any) -> Self:
+        raise MarkupyError(f"{self!r} cannot contain children")
+
+    @override
+    def __repr__(self) -> str:
+        return "<markupy.JsonScript>"
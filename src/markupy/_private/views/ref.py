@@ -0,0 +1,72 @@
+from collections.abc import Iterator
+from importlib import import_module
+from typing import Any
+
+from typing_extensions import override
+
+from markupy.exceptions import MarkupyError
+
+from .view import View
+
+# Resolved classes by dotted path, unbounded like the elements registry
+_components: dict[str, type[View]] = {}
+
+
+def resolve_component(path: str) -> type[View]:
+    try:
+        return _components[path]
+    except KeyError:
+        pass
+    module_name, _, name = path.rpartition(".")
+    if not module_name:
+        raise MarkupyError(f"Invalid component path {path!r}, must be a dotted path")
+    try:
+        cls = getattr(import_module(module_name), name)
+    except (ImportError, AttributeError) as e:
+        raise MarkupyError(f"Unable to import component {path!r}") from e
+    if not (isinstance(cls, type) and issubclass(cls, View)):
+        raise MarkupyError(
+            f"{path!r} must be a subclass of <markupy.Component> or <markupy.View>"
+        )
+    # Imports are thread safe, concurrent resolutions get the same class
+    return _components.setdefault(path, cls)
+
+
+class Ref(View):
+    """Component referenced by its dotted path, such as
+    `Ref("shop.components.CartWidget", **props)`.
+
+    The module of the component is only imported when the reference is first
+    rendered, which allows large applications to start without importing
+    every component they might render.
+    """
+
+    __slots__ = ("_path", "_props")
+
+    def __init__(self, path: str, /, **props: Any) -> None:
+        super().__init__()
+        self._path = path
+        self._props = props
+
+    @staticmethod
+    def warmup(*paths: str) -> None:
+        """Resolve components upfront, typically when a worker starts."""
+        for path in paths:
+            resolve_component(path)
+
+    def resolve(self) -> View:
+        component = resolve_component(self._path)(**self._props)
+        if self._children:
+            # Children are already processed, pass them through a single view
+            content = View()
+            content._children = self._children
+            component = component[content]
+        return component
+
+    @override
+    def __iter__(self) -> Iterator[str]:
+        yield from self.resolve()
+
+    @override
+    def __repr__(self) -> str:
+        return f"<markupy.Ref {self._path!r}>"
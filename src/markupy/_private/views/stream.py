@@ -0,0 +1,74 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from concurrent import futures
+from threading import Event
+
+from markupy.exceptions import MarkupyError
+
+from .view import View
+
+
+async def iter_async(
+    view: View, *, buffer_size: int = 16384, max_queued: int = 4
+) -> AsyncGenerator[str, None]:
+    """Render a view in a worker thread without blocking the event loop.
+
+    Rendered chunks are grouped up to `buffer_size` characters and handed back to
+    the event loop through a queue of at most `max_queued` items: the worker thread
+    pauses when the consumer is too slow and stops as soon as the consumer goes away.
+    """
+    if buffer_size < 1:
+        raise MarkupyError(f"Invalid value {buffer_size!r} for `buffer_size`")
+    if max_queued < 1:
+        raise MarkupyError(f"Invalid value {max_queued!r} for `max_queued`")
+
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[str | BaseException | None] = asyncio.Queue(max_queued)
+    stopped = Event()
+
+    def put(item: str | BaseException | None) -> None:
+        if stopped.is_set():
+            return
+        # Blocks the worker thread while the queue is full, but gives up as soon
+        # as the consumer goes away (the queue may never be drained again)
+        future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+        while not stopped.is_set():
+            try:
+                return future.result(timeout=0.05)
+            except futures.TimeoutError:
+                pass
+        future.cancel()
+
+    def produce() -> None:
+        try:
+            buffer: list[str] = []
+            size = 0
+            for chunk in view:
+                if stopped.is_set():
+                    return
+                buffer.append(chunk)
+                size += len(chunk)
+                if size >= buffer_size:
+                    put("".join(buffer))
+                    buffer.clear()
+                    size = 0
+            if buffer:
+                put("".join(buffer))
+            put(None)
+        except BaseException as e:
+            put(e)
+
+    # to_thread() runs the worker in a copy of the current context
+    worker = asyncio.ensure_future(asyncio.to_thread(produce))
+    try:
+        while (item := await queue.get()) is not None:
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+        await worker
+    finally:
+        # Consumer is done (or went away): stop the worker and release it
+        # in case it is waiting for some room in the queue
+        stopped.set()
+        while not queue.empty():
+            queue.get_nowait()
@@ -1,15 +1,61 @@
 from collections.abc import Iterable, Iterator
 from inspect import isclass, isfunction, ismethod
-from typing import Any, TypeAlias, final
+from typing import Any, SupportsIndex, TypeAlias, TypeVar, final
 
 from markupsafe import Markup, escape
 from typing_extensions import Self
 
 from ...exceptions import MarkupyError
+from ..mode import is_strict_mode
 
 ChildType: TypeAlias = "str | View"
 ChildrenType: TypeAlias = tuple[ChildType, ...]
 
+V = TypeVar("V", bound="View")
+
+
+def _iter_flat(children: ChildrenType) -> Iterator[ChildType]:
+    for node in children:
+        if isinstance(node, View) and type(node).__iter__ is View.__iter__:
+            # Views that only render their children (such as fragments) can be inlined
+            yield from _iter_flat(node._children)
+        else:
+            yield node
+
+
+def _flatten(children: ChildrenType) -> ChildrenType:
+    # Compact representation of children used for pickling
+    flat: list[ChildType] = []
+    for node in _iter_flat(children):
+        if isinstance(node, View):
+            flat.append(node)
+        elif flat and isinstance(last := flat[-1], str):
+            # Merge adjacent strings (as plain str, not Markup)
+            flat[-1] = str.__add__(last, node)
+        else:
+            flat.append(str(node))
+    return tuple(flat)
+
+
+def _restore_view(cls: type[V], safe: bool, children: ChildrenType) -> V:
+    view = cls.__new__(cls)
+    view._safe = safe
+    view._children = children
+    return view
+
+
+def _clone(view: V) -> V:
+    # Copy of every slot (and __dict__ entry) of a view, without calling __init__
+    clone = type(view).__new__(type(view))
+    for cls in type(view).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ("__dict__", "__weakref__") and hasattr(view, name):
+                setattr(clone, name, getattr(view, name))
+    if hasattr(view, "__dict__"):
+        clone.__dict__.update(view.__dict__)
+    return clone
+
 
 class View:
     __slots__ = ("_children", "_safe")
@@ -40,6 +86,15 @@ class View:
     def __repr__(self) -> str:
         return "<markupy.View>"
 
+    def __reduce_ex__(self, protocol: SupportsIndex) -> str | tuple[Any, ...]:
+        if type(self) in compact_pickling:
+            return self._compact_reduce()
+        # Subclasses may hold any state of their own: default pickling
+        return super().__reduce_ex__(protocol)
+
+    def _compact_reduce(self) -> str | tuple[Any, ...]:
+        return (_restore_view, (type(self), self._safe, _flatten(self._children)))
+
     def __iter__(self) -> Iterator[str]:
         for node in self._children:
             if isinstance(node, View):
@@ -47,17 +102,23 @@ class View:
             else:
                 yield node
 
-    def _iter_node(self, node: Any) -> Iterator[ChildType]:
-        if node is None or isinstance(node, bool):
+    def _iter_node(self, node: Any, strict: bool = True) -> Iterator[ChildType]:
+        if isinstance(node, str):
+            # Fast path for the most common case
+            if node:
+                yield str(node if self._safe else escape(node))
+            return
+        elif node is None or isinstance(node, bool):
             return
         elif isinstance(node, View):
             # View is Iterable, must check in priority
             yield node
         elif isinstance(node, Iterable) and not isinstance(node, str):
             for child in node:  # type: ignore[unused-ignore]
-                yield from self._iter_node(child)
-        elif isfunction(node) or ismethod(node) or isclass(node):
+                yield from self._iter_node(child, strict)
+        elif strict and (isfunction(node) or ismethod(node) or isclass(node)):
             # Allows to catch uncalled functions/methods or uninstanciated classes
+            # (skipped when strict mode is disabled, they get rendered as text)
             raise MarkupyError(
                 f"Invalid child node {node!r} provided for {self!r}; Did you mean `{node.__name__}()` ?"
             )
@@ -75,7 +136,14 @@ class View:
         if self._children:
             raise MarkupyError(f"Illegal attempt to redefine children of {self!r}")
 
-        if children := tuple(self._iter_node(content)):
+        children: ChildrenType
+        if isinstance(content, View):
+            # Fast path for a single child element
+            children = (content,)
+        else:
+            children = tuple(self._iter_node(content, is_strict_mode()))
+
+        if children:
             instance = self._get_instance()
             instance._children = children
             return instance
@@ -91,3 +159,7 @@ class View:
     @final
     def encode(self, encoding: str = "utf-8", errors: str = "strict") -> bytes:
         return str(self).encode(encoding, errors)
+
+
+# Internal classes pickled in a compact form, only made of their children and flags
+compact_pickling: set[type[View]] = {View}
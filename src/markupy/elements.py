@@ -1,4 +1,4 @@
-from ._private import views as _views
+from ._private.views import element as _element
 
 __all__ = [
     "_",
@@ -119,122 +119,129 @@ __all__ = [
 ]
 
 
-def __getattr__(name: str) -> _views.Element:
-    return _views.get_element(name)
+# Standard elements are resolved once and stored in the module namespace,
+# so that accessing them is a plain module attribute lookup
+globals().update(_element.preload_elements(__all__))
 
 
-_: _views.Element
-A: _views.Element
-Abbr: _views.Element
-Abc: _views.Element
-Address: _views.Element
-Area: _views.Element
-Article: _views.Element
-Aside: _views.Element
-Audio: _views.Element
-B: _views.Element
-Base: _views.Element
-Bdi: _views.Element
-Bdo: _views.Element
-Blockquote: _views.Element
-Body: _views.Element
-Br: _views.Element
-Button: _views.Element
-Canvas: _views.Element
-Caption: _views.Element
-Cite: _views.Element
-Code: _views.Element
-Col: _views.Element
-Colgroup: _views.Element
-Data: _views.Element
-Datalist: _views.Element
-Dd: _views.Element
-Del: _views.Element
-Details: _views.Element
-Dfn: _views.Element
-Dialog: _views.Element
-Div: _views.Element
-Dl: _views.Element
-Dt: _views.Element
-Em: _views.Element
-Embed: _views.Element
-Fieldset: _views.Element
-Figcaption: _views.Element
-Figure: _views.Element
-Footer: _views.Element
-Form: _views.Element
-H1: _views.Element
-H2: _views.Element
-H3: _views.Element
-H4: _views.Element
-H5: _views.Element
-H6: _views.Element
-Head: _views.Element
-Header: _views.Element
-Hgroup: _views.Element
-Hr: _views.Element
-Html: _views.Element
-I: _views.Element  # noqa: E741
-Iframe: _views.Element
-Img: _views.Element
-Input: _views.Element
-Ins: _views.Element
-Kbd: _views.Element
-Label: _views.Element
-Legend: _views.Element
-Li: _views.Element
-Link: _views.Element
-Main: _views.Element
-Map: _views.Element
-Mark: _views.Element
-Menu: _views.Element
-Meta: _views.Element
-Meter: _views.Element
-Nav: _views.Element
-Noscript: _views.Element
-Object: _views.Element
-Ol: _views.Element
-Optgroup: _views.Element
-Option: _views.Element
-Output: _views.Element
-P: _views.Element
-Param: _views.Element
-Picture: _views.Element
-Portal: _views.Element
-Pre: _views.Element
-Progress: _views.Element
-Q: _views.Element
-Rp: _views.Element
-Rt: _views.Element
-Ruby: _views.Element
-S: _views.Element
-Samp: _views.Element
-Script: _views.Element
-Search: _views.Element
-Section: _views.Element
-Select: _views.Element
-Slot: _views.Element
-Small: _views.Element
-Source: _views.Element
-Span: _views.Element
-Strong: _views.Element
-Style: _views.Element
-Sub: _views.Element
-Summary: _views.Element
-Sup: _views.Element
-Table: _views.Element
-Tbody: _views.Element
-Td: _views.Element
-Template: _views.Element
-Textarea: _views.Element
-Tfoot: _views.Element
-Th: _views.Element
-Thead: _views.Element
-Time: _views.Element
-Title: _views.Element
-Tr: _views.Element
-Track: _views.Element
-U: _views.Element
-Ul: _views.Element
-Var: _views.Element
-Wbr: _views.Element
+def __getattr__(name: str) -> _element.Element:
+    # Only called for custom elements, that are also stored once resolved
+    element = globals()[name] = _element.get_element(name)
+    return element
+
+
+_: _element.Element
+A: _element.Element
+Abbr: _element.Element
+Abc: _element.Element
+Address: _element.Element
+Area: _element.Element
+Article: _element.Element
+Aside: _element.Element
+Audio: _element.Element
+B: _element.Element
+Base: _element.Element
+Bdi: _element.Element
+Bdo: _element.Element
+Blockquote: _element.Element
+Body: _element.Element
+Br: _element.Element
+Button: _element.Element
+Canvas: _element.Element
+Caption: _element.Element
+Cite: _element.Element
+Code: _element.Element
+Col: _element.Element
+Colgroup: _element.Element
+Data: _element.Element
+Datalist: _element.Element
+Dd: _element.Element
+Del: _element.Element
+Details: _element.Element
+Dfn: _element.Element
+Dialog: _element.Element
+Div: _element.Element
+Dl: _element.Element
+Dt: _element.Element
+Em: _element.Element
+Embed: _element.Element
+Fieldset: _element.Element
+Figcaption: _element.Element
+Figure: _element.Element
+Footer: _element.Element
+Form: _element.Element
+H1: _element.Element
+H2: _element.Element
+H3: _element.Element
+H4: _element.Element
+H5: _element.Element
+H6: _element.Element
+Head: _element.Element
+Header: _element.Element
+Hgroup: _element.Element
+Hr: _element.Element
+Html: _element.Element
+I: _element.Element  # noqa: E741
+Iframe: _element.Element
+Img: _element.Element
+Input: _element.Element
+Ins: _element.Element
+Kbd: _element.Element
+Label: _element.Element
+Legend: _element.Element
+Li: _element.Element
+Link: _element.Element
+Main: _element.Element
+Map: _element.Element
+Mark: _element.Element
+Menu: _element.Element
+Meta: _element.Element
+Meter: _element.Element
+Nav: _element.Element
+Noscript: _element.Element
+Object: _element.Element
+Ol: _element.Element
+Optgroup: _element.Element
+Option: _element.Element
+Output: _element.Element
+P: _element.Element
+Param: _element.Element
+Picture: _element.Element
+Portal: _element.Element
+Pre: _element.Element
+Progress: _element.Element
+Q: _element.Element
+Rp: _element.Element
+Rt: _element.Element
+Ruby: _element.Element
+S: _element.Element
+Samp: _element.Element
+Script: _element.Element
+Search: _element.Element
+Section: _element.Element
+Select: _element.Element
+Slot: _element.Element
+Small: _element.Element
+Source: _element.Element
+Span: _element.Element
+Strong: _element.Element
+Style: _element.Element
+Sub: _element.Element
+Summary: _element.Element
+Sup: _element.Element
+Table: _element.Element
+Tbody: _element.Element
+Td: _element.Element
+Template: _element.Element
+Textarea: _element.Element
+Tfoot: _element.Element
+Th: _element.Element
+Thead: _element.Element
+Time: _element.Element
+Title: _element.Element
+Tr: _element.Element
+Track: _element.Element
+U: _element.Element
+Ul: _element.Element
+Var: _element.Element
+Wbr: _element.Element
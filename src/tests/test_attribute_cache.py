@@ -0,0 +1,121 @@
+from collections.abc import Iterator
+
+import pytest
+
+from markupy import Attribute, attribute_handlers, set_attribute_cache_size
+from markupy import attributes as at
+from markupy import elements as el
+from markupy._private.attributes.cache import AttributeCache, attribute_cache
+from markupy.exceptions import MarkupyError
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> Iterator[None]:
+    attribute_cache.clear()
+    yield
+    attribute_cache.clear()
+
+
+def test_cached() -> None:
+    assert (
+        el.Div(".foo", {"a": "b"}, c="d") == """<div class="foo" a="b" c="d"></div>"""
+    )
+    assert len(attribute_cache) == 1
+    assert (
+        el.Div(".foo", {"a": "b"}, c="d") == """<div class="foo" a="b" c="d"></div>"""
+    )
+    assert len(attribute_cache) == 1
+    # Same signature, different element
+    assert (
+        el.Span(".foo", {"a": "b"}, c="d")
+        == """<span class="foo" a="b" c="d"></span>"""
+    )
+    assert len(attribute_cache) == 1
+
+
+def test_value_types() -> None:
+    # True == 1 == 1.0 but they must not share the same cache entry
+    assert el.Div(foo=True) == """<div foo></div>"""
+    assert el.Div(foo=1) == """<div foo="1"></div>"""
+    assert el.Div(foo=1.0) == """<div foo="1.0"></div>"""
+    assert el.Div({"foo": True}) == """<div foo></div>"""
+    assert el.Div({"foo": 1}) == """<div foo="1"></div>"""
+    assert el.Div(("foo", True)) == """<div foo></div>"""
+    assert el.Div(("foo", 1)) == """<div foo="1"></div>"""
+
+
+def test_not_cached() -> None:
+    el.Div(Attribute("foo", "bar"))
+    el.Div("#foo.bar")
+    el.Div(id="foo")
+    assert len(attribute_cache) == 0
+    with pytest.raises(MarkupyError):
+        el.Div(foo=[])  # type: ignore[call-overload]
+    with pytest.raises(MarkupyError):
+        el.Div(Foo="bar")
+    with pytest.raises(MarkupyError):
+        el.Div(Foo="bar")
+    assert len(attribute_cache) == 0
+
+
+def test_invalidated_by_handlers() -> None:
+    def handler(old: Attribute | None, new: Attribute) -> Attribute | None:
+        new.value = f"{new.value}!"
+        return None
+
+    assert el.Div(".foo", bar="baz") == """<div class="foo" bar="baz"></div>"""
+    attribute_handlers.register(handler)
+    try:
+        assert el.Div(".foo", bar="baz") == """<div class="foo!" bar="baz!"></div>"""
+    finally:
+        attribute_handlers.unregister(handler)
+    assert el.Div(".foo", bar="baz") == """<div class="foo" bar="baz"></div>"""
+
+
+def test_bounded() -> None:
+    cache = AttributeCache(maxsize=2)
+    chain = attribute_handlers._chain
+    cache.set("a", "1", chain)
+    cache.set("b", "2", chain)
+    cache.set("c", "3", chain)
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache.get("b") == "2"
+    assert cache.get("c") == "3"
+
+
+def test_set_disabled() -> None:
+    # Disabled by another thread after the `enabled` check of an element
+    cache = AttributeCache(maxsize=2)
+    cache.resize(0)
+    cache.set("a", "1", attribute_handlers._chain)
+    assert len(cache) == 0
+
+
+def test_constant_attributes() -> None:
+    assert el.Input(at.disabled()) == """<input disabled>"""
+    assert el.Input(at.disabled()) == """<input disabled>"""
+    assert len(attribute_cache) == 1
+
+
+def test_disabled() -> None:
+    calls: list[str] = []
+
+    def handler(old: Attribute | None, new: Attribute) -> Attribute | None:
+        calls.append(new.name)
+        return None
+
+    set_attribute_cache_size(0)
+    attribute_handlers.register(handler)
+    try:
+        el.Div(foo="bar")
+        el.Div(foo="bar")
+        assert calls == ["foo", "foo"]
+        assert len(attribute_cache) == 0
+    finally:
+        attribute_handlers.unregister(handler)
+        set_attribute_cache_size(4096)
+    el.Div(foo="bar")
+    assert len(attribute_cache) == 1
+    with pytest.raises(MarkupyError):
+        set_attribute_cache_size(-1)
@@ -1,11 +1,17 @@
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from threading import Barrier
 from typing import Generator
 
 import pytest
 
-from markupy import Attribute, attribute_handlers
+from markupy import Attribute, Attributes, attribute_handlers
 from markupy import elements as el
-from markupy._private.attributes.handlers import AttributeHandler
+from markupy._private.attributes.handlers import (
+    _MAX_CACHED_CHAINS,
+    AttributeHandler,
+)
+from markupy._private.attributes.store import default_attribute_handler
 from markupy.exceptions import MarkupyError
 
 
@@ -83,3 +89,193 @@ def test_prefix_attribute() -> None:
             el.Input("#bar.baz", hello="world")
             == """<input foo-id="bar" foo-class="baz" foo-hello="world">"""
         )
+
+
+def test_register_while_iterating() -> None:
+    def handler(old: Attribute | None, new: Attribute) -> Attribute | None:
+        return None
+
+    # Handlers chain is an immutable snapshot, safe to iterate while it changes
+    try:
+        for _ in attribute_handlers:
+            attribute_handlers.register(handler)
+            attribute_handlers.unregister(handler)
+            attribute_handlers.register(handler)
+    finally:
+        attribute_handlers.unregister(handler)
+
+
+def test_selector_only() -> None:
+    def handler(old: Attribute | None, new: Attribute) -> Attribute | None:
+        new.value = f"{new.value}-x"
+        return None
+
+    # Selector alone must still go through custom handlers
+    with tmp_handler(handler):
+        assert el.Input("#foo.bar") == """<input id="foo-x" class="bar-x">"""
+    assert el.Input("#foo.bar") == """<input id="foo" class="bar">"""
+
+
+def test_register_names() -> None:
+    calls: list[str] = []
+
+    @attribute_handlers.register(names=["class", "title"])
+    def handler(old: Attribute | None, new: Attribute) -> Attribute | None:
+        calls.append(new.name)
+        return None
+
+    try:
+        el.Div(".foo", {"title": "bar"}, id="baz", data_title="x")
+        assert calls == ["class", "title"]
+        assert attribute_handlers.chain_for("class")[0] is handler
+        assert handler not in attribute_handlers.chain_for("id")
+    finally:
+        attribute_handlers.unregister(handler)
+    assert handler not in attribute_handlers.chain_for("class")
+
+
+def test_chains_bounded() -> None:
+    @attribute_handlers.register(prefix="data-")
+    def handler(old: Attribute | None, new: Attribute) -> Attribute | None:
+        return None
+
+    try:
+        for i in range(_MAX_CACHED_CHAINS + 100):
+            assert attribute_handlers.chain_for(f"data-{i}")[0] is handler
+            assert handler not in attribute_handlers.chain_for(f"hx-{i}")
+        assert len(attribute_handlers._chains[1]) == _MAX_CACHED_CHAINS
+    finally:
+        attribute_handlers.unregister(handler)
+
+
+def test_register_prefix() -> None:
+    def handler(old: Attribute | None, new: Attribute) -> Attribute | None:
+        new.value = f"/cdn{new.value}"
+        return None
+
+    attribute_handlers.register(handler, prefix=("hx-get", "hx-post"))
+    try:
+        assert (
+            el.Div(hx_get="/a", hx_post_x="/b", hx_put="/c", href="/d")
+            == """<div hx-get="/cdn/a" hx-post-x="/cdn/b" hx-put="/c" href="/d"></div>"""
+        )
+    finally:
+        attribute_handlers.unregister(handler)
+
+    attribute_handlers.register(handler, names="href", prefix="src")
+    try:
+        assert (
+            el.Img(href="/a", srcset="/b", hreflang="en")
+            == """<img href="/cdn/a" srcset="/cdn/b" hreflang="en">"""
+        )
+    finally:
+        attribute_handlers.unregister(handler)
+
+    with pytest.raises(MarkupyError):
+        attribute_handlers.register(handler)
+        attribute_handlers.register(handler, names=["id"])
+    attribute_handlers.unregister(handler)
+
+
+def cdn_handler(old: Attribute | None, new: Attribute) -> Attribute | None:
+    new.value = f"https://cdn.example.com{new.value}"
+    return None
+
+
+def suffix_handler(old: Attribute | None, new: Attribute) -> Attribute | None:
+    new.value = f"{new.value}?v=1"
+    return None
+
+
+def test_scope() -> None:
+    assert el.Img(src="/a.png") == """<img src="/a.png">"""
+    with attribute_handlers.scope() as handlers:
+        handlers.register(cdn_handler, names=["src"])
+        assert el.Img(src="/a.png", alt="/b") == (
+            """<img src="https://cdn.example.com/a.png" alt="/b">"""
+        )
+        assert cdn_handler not in attribute_handlers
+    assert el.Img(src="/a.png") == """<img src="/a.png">"""
+
+
+def test_scope_nested() -> None:
+    cdn = attribute_handlers.overlay()
+    cdn.register(cdn_handler, names=["src"])
+    versioned = attribute_handlers.overlay()
+    versioned.register(suffix_handler, names=["src"])
+
+    with attribute_handlers.scope(cdn):
+        with attribute_handlers.scope(versioned):
+            # Innermost overlay first
+            assert el.Img(src="/a.png") == (
+                """<img src="https://cdn.example.com/a.png?v=1">"""
+            )
+        assert el.Img(src="/a.png") == """<img src="https://cdn.example.com/a.png">"""
+        # Global handlers are called after the overlay ones
+        attribute_handlers.register(suffix_handler)
+        try:
+            assert el.Img(src="/a.png") == (
+                """<img src="https://cdn.example.com/a.png?v=1">"""
+            )
+        finally:
+            attribute_handlers.unregister(suffix_handler)
+
+
+def test_scope_bundle() -> None:
+    bundle = Attributes(src="/a.png")
+    assert el.Img(bundle) == """<img src="/a.png">"""
+    with attribute_handlers.scope() as handlers:
+        handlers.register(cdn_handler)
+        assert el.Img(bundle) == """<img src="https://cdn.example.com/a.png">"""
+    assert el.Img(bundle) == """<img src="/a.png">"""
+
+
+def test_scope_threads() -> None:
+    overlay = attribute_handlers.overlay()
+    overlay.register(cdn_handler, names=["src"])
+    barrier = Barrier(2)
+
+    def render(scoped: bool) -> str:
+        if scoped:
+            with attribute_handlers.scope(overlay):
+                barrier.wait()
+                return str(el.Img(src="/a.png"))
+        barrier.wait()
+        return str(el.Img(src="/a.png"))
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        scoped, unscoped = executor.map(render, (True, False))
+    assert scoped == """<img src="https://cdn.example.com/a.png">"""
+    assert unscoped == """<img src="/a.png">"""
+
+
+def test_attribute_not_mutated() -> None:
+    def handler(old: Attribute | None, new: Attribute) -> Attribute | None:
+        new.value = "bar"
+        return None
+
+    attribute = Attribute("foo", "baz")
+    with tmp_handler(handler):
+        assert el.Div(attribute) == """<div foo="bar"></div>"""
+    assert attribute.value == "baz"
+
+
+def test_class_merge_with_handler() -> None:
+    def handler(old: Attribute | None, new: Attribute) -> Attribute | None:
+        if old is not None:
+            assert old.value in ("a", "a b")
+        return None
+
+    with tmp_handler(handler):
+        assert (
+            el.Div(".a", {"class": "b a"}, class_="c")
+            == """<div class="a b c"></div>"""
+        )
+
+
+def test_no_default_handler() -> None:
+    attribute_handlers.unregister(default_attribute_handler)
+    try:
+        assert el.Div(".a", id="b", class_="c") == """<div class="c" id="b"></div>"""
+    finally:
+        attribute_handlers.register(default_attribute_handler)
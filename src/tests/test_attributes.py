@@ -87,6 +87,19 @@ def test_class_merge() -> None:
     )
 
 
+def test_class_merge_many() -> None:
+    classes = [{"class": f"c{i % 10} c{i}"} for i in range(100)]
+    result = " ".join(
+        [*(f"c{i}" for i in range(10)), *(f"c{i}" for i in range(10, 100))]
+    )
+    assert el.Div(*classes, class_=None) == f"""<div class="{result}"></div>"""
+    # Classes are only deduplicated when merged
+    assert el.Div(".a.a") == """<div class="a a"></div>"""
+    assert el.Div(".a.a", class_="b") == """<div class="a b"></div>"""
+    assert el.Div(".a", class_="a") == """<div class="a"></div>"""
+    assert el.Div(".a", {"class": "b"}, class_="a b") == """<div class="a b"></div>"""
+
+
 @pytest.mark.parametrize("not_an_attr", [1234, b"foo", object(), object, 1, 0, None])
 def test_invalid_attribute_key(not_an_attr: t.Any) -> None:
     with pytest.raises(MarkupyError):
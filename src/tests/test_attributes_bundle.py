@@ -0,0 +1,99 @@
+import pytest
+
+import markupy.attributes as at
+import markupy.elements as el
+from markupy import Attribute, Attributes, attribute_handlers
+from markupy.exceptions import MarkupyError
+
+htmx = Attributes(".htmx", at.hx_target("#main"), hx_swap="outerHTML", hx_boost=True)
+
+
+def test_bundle_alone() -> None:
+    result = (
+        """<form class="htmx" hx-target="#main" hx-swap="outerHTML" hx-boost></form>"""
+    )
+    assert (
+        str(htmx) == """class="htmx" hx-target="#main" hx-swap="outerHTML" hx-boost"""
+    )
+    assert el.Form(htmx) == result
+    assert list(htmx) == [
+        ("class", "htmx"),
+        ("hx-target", "#main"),
+        ("hx-swap", "outerHTML"),
+        ("hx-boost", True),
+    ]
+
+
+def test_bundle_merge() -> None:
+    assert (
+        el.Form("#foo.form", htmx, {"method": "post"}, class_="bar")
+        == """<form id="foo" class="form htmx bar" hx-target="#main" hx-swap="outerHTML" hx-boost method="post"></form>"""
+    )
+    bundle = Attributes(title="<&>", data_count=1)
+    assert el.Div(bundle, htmx) == (
+        """<div title="&lt;&amp;&gt;" data-count="1" class="htmx" hx-target="#main" hx-swap="outerHTML" hx-boost></div>"""
+    )
+    # Redefining with the same value is allowed
+    assert (
+        el.Div(bundle, title="<&>")
+        == """<div title="&lt;&amp;&gt;" data-count="1"></div>"""
+    )
+    with pytest.raises(MarkupyError):
+        el.Div(bundle, title="other")
+
+
+def test_bundle_nested() -> None:
+    bundle = Attributes(htmx, id="foo")
+    assert (
+        str(bundle)
+        == """class="htmx" hx-target="#main" hx-swap="outerHTML" hx-boost id="foo\""""
+    )
+
+
+def test_bundle_invalid() -> None:
+    with pytest.raises(MarkupyError):
+        Attributes(Foo="bar")
+    with pytest.raises(MarkupyError):
+        Attributes(1)
+    with pytest.raises(MarkupyError):
+        Attributes(foo=[])  # type: ignore[arg-type]
+
+
+def test_bundle_handlers() -> None:
+    def handler(old: Attribute | None, new: Attribute) -> Attribute | None:
+        if new.name == "hx-swap":
+            new.value = "innerHTML"
+        return None
+
+    attribute_handlers.register(handler)
+    try:
+        assert el.Form(htmx) == (
+            """<form class="htmx" hx-target="#main" hx-swap="innerHTML" hx-boost></form>"""
+        )
+        assert el.Form(htmx, id="foo") == (
+            """<form class="htmx" hx-target="#main" hx-swap="innerHTML" hx-boost id="foo"></form>"""
+        )
+    finally:
+        attribute_handlers.unregister(handler)
+    assert el.Form(htmx) == (
+        """<form class="htmx" hx-target="#main" hx-swap="outerHTML" hx-boost></form>"""
+    )
+
+
+def test_bundle_conflict_handlers_run_once() -> None:
+    @attribute_handlers.register(names=["src"])
+    def cdn(old: Attribute | None, new: Attribute) -> Attribute | None:
+        if new.value is not None:
+            new.value = f"https://cdn{new.value}"
+        return None
+
+    try:
+        image = Attributes(src="/a.png")
+        nested = Attributes(image)
+        expected = """<img src="https://cdn/a.png">"""
+        assert el.Img(image) == expected
+        assert el.Img({"src": None}, src="/a.png") == expected
+        assert el.Img({"src": None}, image) == expected
+        assert el.Img({"src": None}, nested) == expected
+    finally:
+        attribute_handlers.unregister(cdn)
@@ -0,0 +1,60 @@
+import json
+import pickle
+
+import pytest
+
+import markupy.elements as el
+from markupy import Attribute, Attributes, JsonValue
+from markupy.exceptions import MarkupyError
+
+
+def test_json_value() -> None:
+    value = JsonValue({"a": [1, 2], "b": "<'é'>", "c": None})
+    assert value == """{"a":[1,2],"b":"<'é'>","c":null}"""
+    assert (
+        el.Div(data_props=value)
+        == """<div data-props="{&#34;a&#34;:[1,2],&#34;b&#34;:&#34;&lt;&#39;é&#39;&gt;&#34;,&#34;c&#34;:null}"></div>"""
+    )
+    assert el.Div(hx_vals=JsonValue(1)) == """<div hx-vals="1"></div>"""
+    assert str(Attribute("data-x", JsonValue([]))) == """data-x="[]\""""
+
+
+def test_json_value_same_output() -> None:
+    obj = {"user": {"id": 1, "name": 'Jane "JD" <Doe>'}, "tags": ["a&b"]}
+    serialized = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    assert el.Div(data_props=JsonValue(obj)) == el.Div(data_props=serialized)
+    assert el.Div(Attributes(data_props=JsonValue(obj))) == el.Div(
+        data_props=str(JsonValue(obj))
+    )
+
+
+def test_json_value_cache() -> None:
+    first, second = JsonValue({"a": 1}), JsonValue({"a": 1})
+    assert first is not second
+    assert first.escaped is second.escaped
+
+
+def test_json_value_large_not_cached() -> None:
+    obj = {"data": "<x>" * 10_000}
+    first, second = JsonValue(obj), JsonValue(obj)
+    assert first.escaped == second.escaped
+    assert first.escaped is not second.escaped
+
+
+def test_json_value_options() -> None:
+    assert JsonValue({"b": 1, "a": 2}, sort_keys=True) == """{"a":2,"b":1}"""
+    assert JsonValue("é", ensure_ascii=True) == '"\\u00e9"'
+    with pytest.raises(TypeError):
+        JsonValue(object())
+
+
+def test_json_value_pickle() -> None:
+    value = pickle.loads(pickle.dumps(JsonValue({"a": "<b>"})))
+    assert type(value) is JsonValue
+    assert value == """{"a":"<b>"}"""
+    assert value.escaped == "{&#34;a&#34;:&#34;&lt;b&gt;&#34;}"
+
+
+def test_json_value_invalid_key() -> None:
+    with pytest.raises(MarkupyError):
+        el.Div({"data props": JsonValue(1)})
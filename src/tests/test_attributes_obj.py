@@ -1,6 +1,9 @@
+import pytest
+
 import markupy.attributes as at
 import markupy.elements as el
 from markupy import Attribute
+from markupy.exceptions import MarkupyError
 
 
 def test_int() -> None:
@@ -50,3 +53,27 @@ def test_none() -> None:
     assert el.Input(at.foo("bar"), None) == """<input foo="bar">"""
     assert el.Input(None, at.foo("bar")) == """<input foo="bar">"""
     assert el.Input(None, foo="bar") == """<input foo="bar">"""
+
+
+def test_constant_attributes() -> None:
+    assert at.disabled() is at.disabled(True)
+    assert at.disabled(False) is at.disabled(False)
+    assert at.disabled() is not at.disabled(False)
+    assert at.type_("submit") is at.type_("submit")
+    with pytest.raises(MarkupyError):
+        at.disabled().value = False
+    assert at.disabled().value is True
+    with pytest.raises(MarkupyError):
+        at.disabled([])  # type: ignore[arg-type]
+    # 1 == True but they render differently
+    assert el.Input(at.hidden(True)) == """<input hidden>"""
+    assert el.Input(at.hidden(1)) == """<input hidden="1">"""  # type: ignore[arg-type]
+    assert (
+        el.Input(at.disabled(), at.type_("submit"))
+        == """<input disabled type="submit">"""
+    )
+
+
+def test_dynamic_attribute_cache() -> None:
+    assert at.foo_bar is at.foo_bar
+    assert el.Input(at.foo_bar("baz")) == """<input foo-bar="baz">"""
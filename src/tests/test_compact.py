@@ -0,0 +1,67 @@
+import pickle
+
+import pytest
+
+from markupy import CompactBuilder
+from markupy import elements as el
+from markupy.exceptions import MarkupyError
+
+
+def test_compact() -> None:
+    builder = CompactBuilder()
+    with builder.element(el.Tbody):
+        for row in range(3):
+            with builder.element(el.Tr(".row")), builder.element(el.Td):
+                builder.append(row)
+                builder.append(" <")
+    view = builder.build()
+    expected = "<tbody>" + "".join(
+        f"""<tr class="row"><td>{row} &lt;</td></tr>""" for row in range(3)
+    )
+    assert view == expected + "</tbody>"
+    # Strings are stored once
+    assert len(view._strings) == 10
+    assert len(view._refs) == 20
+
+
+def test_compact_as_child() -> None:
+    builder = CompactBuilder()
+    builder.append(["a", None, el.B["b"], el.Br])
+    assert el.P[builder.build(), "c"] == "<p>a<b>b</b><br>c</p>"
+
+
+def test_compact_special_elements() -> None:
+    builder = CompactBuilder()
+    with builder.element(el.Html), builder.element(el.Script):
+        builder.append("<")
+    builder.open(el._)
+    builder.append("<")
+    builder.close()
+    assert (
+        builder.build() == "<!doctype html><html><script><</script></html><!--&lt;-->"
+    )
+
+
+def test_compact_errors() -> None:
+    builder = CompactBuilder()
+    with pytest.raises(MarkupyError):
+        builder.open(el.Input)
+    with pytest.raises(MarkupyError):
+        builder.open(el.P["a"])
+    with pytest.raises(MarkupyError):
+        builder.close()
+    builder.open(el.Div)
+    with pytest.raises(MarkupyError):
+        builder.build()
+    builder.close()
+    view = builder.build()
+    with pytest.raises(MarkupyError):
+        view["a"]
+
+
+def test_compact_pickle() -> None:
+    builder = CompactBuilder()
+    with builder.element(el.P):
+        builder.append("a")
+    view = builder.build()
+    assert pickle.loads(pickle.dumps(view)) == "<p>a</p>"
@@ -1,8 +1,9 @@
 from dataclasses import dataclass, field
+from typing import ClassVar
 
 import pytest
 
-from markupy import Component, Fragment, View, elements
+from markupy import Component, Fragment, View, component_slots, elements
 from markupy.exceptions import MarkupyError
 
 
@@ -111,3 +112,76 @@ class DataComponent(Component):
 def test_dataclass_component() -> None:
     result = """<a href="https://google.com">Google</a>"""
     assert DataComponent()["Google"] == result
+
+
+@component_slots
+class SlottedComponent(Component):
+    title: str
+    count: int
+    prefix: ClassVar[str] = "#"
+
+    def __init__(self, title: str, count: int = 0) -> None:
+        super().__init__()
+        self.title = title
+        self.count = count
+
+    def render(self) -> View:
+        return elements.H1[self.prefix, self.title, self.count, self.render_content()]
+
+
+@component_slots
+class SlottedChildComponent(SlottedComponent):
+    extra: str
+
+    def __init__(self, title: str) -> None:
+        super().__init__(title, count=1)
+        self.extra = "!"
+
+    def render(self) -> View:
+        return elements.Div[super().render(), self.extra]
+
+
+def test_slotted_component() -> None:
+    component = SlottedComponent("Hello", 2)
+    assert not hasattr(component, "__dict__")
+    assert SlottedComponent.__dict__["__slots__"] == ("title", "count")
+    assert component["!"] == "<h1>#Hello2!</h1>"
+    assert SlottedChildComponent("Hi") == "<div><h1>#Hi1</h1>!</div>"
+    assert not hasattr(SlottedChildComponent("Hi"), "__dict__")
+    with pytest.raises(AttributeError):
+        component.other = 1  # type: ignore[attr-defined]
+
+
+def test_slotted_component_errors() -> None:
+    with pytest.raises(MarkupyError):
+
+        @component_slots
+        class DefaultComponent(Component):
+            title: str = "default"
+
+            def render(self) -> View:
+                return elements.P[self.title]
+
+    with pytest.raises(MarkupyError):
+        component_slots(DataComponent)
+
+    class UnslottedChildComponent(ComponentElement):
+        title: str
+
+    with pytest.raises(MarkupyError):
+        # ComponentElement does not define slots
+        component_slots(UnslottedChildComponent)
+
+
+@dataclass(slots=True, eq=False)
+class SlotsDataComponent(Component):
+    href: str = field(default="https://google.com")
+
+    def render(self) -> View:
+        return elements.A(href=self.href)[self.render_content()]
+
+
+def test_slots_dataclass_component() -> None:
+    component = SlotsDataComponent()
+    assert not hasattr(component, "__dict__")
+    assert component["Google"] == """<a href="https://google.com">Google</a>"""
@@ -0,0 +1,67 @@
+import threading
+from contextvars import ContextVar
+
+import pytest
+
+from markupy import Component, Concurrent, View
+from markupy import elements as el
+from markupy.exceptions import MarkupyError
+
+request_id: ContextVar[str] = ContextVar("request_id", default="none")
+
+
+class BarrierComponent(Component):
+    def __init__(self, barrier: threading.Barrier, name: str) -> None:
+        super().__init__()
+        self.barrier = barrier
+        self.name = name
+
+    def render(self) -> View:
+        # Would time out if siblings were rendered sequentially
+        self.barrier.wait(timeout=5)
+        return el.Li[self.name, request_id.get()]
+
+
+class ErrorComponent(Component):
+    def render(self) -> View:
+        raise ValueError("boom")
+
+
+def test_concurrent_order() -> None:
+    barrier = threading.Barrier(3)
+    token = request_id.set("!")
+    try:
+        result = el.Ul[
+            Concurrent[
+                BarrierComponent(barrier, "a"),
+                BarrierComponent(barrier, "b"),
+                "text",
+                BarrierComponent(barrier, "c"),
+            ]
+        ]
+        assert result == "<ul><li>a!</li><li>b!</li>text<li>c!</li></ul>"
+    finally:
+        request_id.reset(token)
+
+
+def test_concurrent_max_workers() -> None:
+    assert (
+        Concurrent(max_workers=1)[el.P["a"], el.P["b"], el.P["c"]]
+        == "<p>a</p><p>b</p><p>c</p>"
+    )
+    with pytest.raises(MarkupyError):
+        Concurrent(max_workers=0)
+
+
+def test_concurrent_error() -> None:
+    with pytest.raises(ValueError):
+        str(Concurrent[el.P["a"], ErrorComponent()])
+
+
+def test_concurrent_reuse() -> None:
+    pool = Concurrent(max_workers=2)
+    assert pool[el.P["a"]] == "<p>a</p>"
+    assert pool[el.P["b"]] == "<p>b</p>"
+    assert repr(pool) == "<markupy.Concurrent>"
+    with pytest.raises(MarkupyError):
+        pool[el.P["a"]](max_workers=2)
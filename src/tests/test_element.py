@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
 import pytest
 from markupsafe import Markup
 
@@ -7,6 +10,7 @@ from markupy._private.views.element import (
     Element,
     HtmlElement,
     VoidElement,
+    get_element,
 )
 from markupy.exceptions import MarkupyError
 
@@ -27,6 +31,59 @@ def test_instance_cache() -> None:
     assert el.Div is not el.Div[0]
 
 
+def test_preloaded_elements() -> None:
+    namespace = vars(el)
+    for name in el.__all__:
+        assert namespace[name] is get_element(name)
+    assert isinstance(namespace["Html"], HtmlElement)
+    assert isinstance(namespace["Br"], VoidElement)
+    assert isinstance(namespace["_"], CommentElement)
+    assert el.H1.name == "h1"
+
+
+def test_custom_element_namespace() -> None:
+    assert "MyNamespacedElement" not in vars(el)
+    element = el.MyNamespacedElement
+    assert vars(el)["MyNamespacedElement"] is element
+    assert element.name == "my-namespaced-element"
+
+
+def test_copy() -> None:
+    custom = Element("custom", safe=True)
+    div = custom(".foo")["<bar>"]
+    assert div is not custom
+    # Only safe element classes (script, style) render their copies unescaped
+    assert div == """<custom class="foo">&lt;bar&gt;</custom>"""
+    assert custom == "<custom></custom>"
+    assert type(el.Input(".foo")) is VoidElement
+    assert el.Script("#main") is not el.Script
+    assert el.Script("#main")["<code>"] == """<script id="main"><code></script>"""
+    assert el.Style["<code>"] == """<style><code></style>"""
+    prototype = Element("custom", safe=True, shared=False).prototype()
+    assert prototype["<b>"] == """<custom>&lt;b&gt;</custom>"""
+
+
+def test_prototype() -> None:
+    row = el.Tr(".row", data_foo="<bar>").prototype()
+    assert row == """<tr class="row" data-foo="&lt;bar&gt;"></tr>"""
+    assert row.prototype() is row
+    assert el.Tr.prototype() is el.Tr
+
+    first, second = row[el.Td[1]], row[el.Td[2]]
+    assert first is not row and second is not row
+    assert first == """<tr class="row" data-foo="&lt;bar&gt;"><td>1</td></tr>"""
+    assert second == """<tr class="row" data-foo="&lt;bar&gt;"><td>2</td></tr>"""
+    assert row == """<tr class="row" data-foo="&lt;bar&gt;"></tr>"""
+    assert row[None] is row
+
+    with pytest.raises(MarkupyError):
+        row(".other")
+    with pytest.raises(MarkupyError):
+        first.prototype()
+    with pytest.raises(MarkupyError):
+        first[el.Td[3]]
+
+
 def test_invalid_case() -> None:
     with pytest.raises(MarkupyError):
         el.div
@@ -72,3 +129,35 @@ def test_comment() -> None:
 def test_attributes_after_children() -> None:
     with pytest.raises(MarkupyError):
         el.Div["hello"](id="world")
+
+
+def test_concurrent_get_element() -> None:
+    barrier = Barrier(8)
+
+    def get(name: str) -> Element:
+        barrier.wait(timeout=5)
+        return get_element(name)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        elements = list(executor.map(get, ["ThreadSafeElement"] * 8))
+    assert all(element is el.ThreadSafeElement for element in elements)
+
+
+class Icon(Element):
+    __slots__ = ("size",)
+
+    def __init__(self, size: int = 16) -> None:
+        super().__init__("i")
+        self.size = size
+
+    def _tag_opening(self) -> str:
+        return f'<i data-size="{self.size}">'
+
+
+def test_element_subclass() -> None:
+    icon = Icon(24)
+    assert icon["x"] == '<i data-size="24">x</i>'
+    assert icon(".a")["x"] == '<i data-size="24">x</i>'
+    assert icon.prototype() is icon
+    assert icon(".a").prototype()["y"] == '<i data-size="24">y</i>'
+    assert icon == '<i data-size="24"></i>'
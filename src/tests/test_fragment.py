@@ -3,6 +3,7 @@ from typing import Iterator
 import pytest
 
 from markupy import Fragment
+from markupy._private.views import Fragment as BaseFragment
 from markupy.elements import Div, I, P, Tr
 from markupy.exceptions import MarkupyError
 
@@ -108,3 +109,20 @@ def test_generator() -> None:
     assert Fragment[generator()] == "helloworld"
     with pytest.raises(MarkupyError):
         Fragment[generator]
+
+
+class Separated(BaseFragment):
+    __slots__ = ("separator",)
+
+    def __init__(self, separator: str) -> None:
+        super().__init__()
+        self.separator = separator
+
+    def __iter__(self) -> Iterator[str]:
+        yield self.separator.join(super().__iter__())
+
+
+def test_fragment_subclass() -> None:
+    separated = Separated(", ")
+    assert separated["a", "b"] == "a, b"
+    assert separated == ""
@@ -0,0 +1,62 @@
+from markupy import Component, Fragment, Interner, View
+from markupy import elements as el
+
+
+def icon() -> View:
+    return el.Span(".badge")[el.I(".icon.star"), "New"]
+
+
+def test_intern_subtrees() -> None:
+    interner = Interner()
+    first = interner(icon())
+    second = interner(icon())
+    assert first is second
+    assert first == """<span class="badge"><i class="icon star"></i>New</span>"""
+    assert interner(el.I(".icon.star")) is first._children[0]
+    assert len(interner) == 2
+
+
+def test_intern_in_tree() -> None:
+    interner = Interner()
+    table = interner(el.Tbody[(el.Tr[el.Td(".num")[1], icon()] for _ in range(3))])
+    rows = table._children
+    assert rows[0] is rows[1] is rows[2]
+    assert (
+        table
+        == "<tbody>"
+        + """<tr><td class="num">1</td><span class="badge"><i class="icon star"></i>New</span></tr>"""
+        * 3
+        + "</tbody>"
+    )
+
+
+def test_intern_distinct() -> None:
+    interner = Interner()
+    assert interner(el.P["a"]) is not interner(el.P["b"])
+    assert interner(el.P(id="a")) is not interner(el.P(id="b"))
+    assert interner(el.P["a"]) is not interner(el.Div["a"])
+    assert interner(el.Script["<"]) is not interner(el.P["<"])
+    assert interner(Fragment[el.P]) is not interner(el.Div[el.P])
+
+
+def test_intern_attribute_strings() -> None:
+    interner = Interner()
+    first = interner(el.Td(".num")[1])
+    second = interner(el.Td(".num")[2])
+    assert first._attributes is second._attributes
+
+
+class Card(Component):
+    def render(self) -> View:
+        return el.Div(".card")
+
+
+def test_intern_untouched() -> None:
+    interner = Interner()
+    card = Card()
+    assert interner(card) is card
+    assert interner(el.Div) is el.Div
+    assert len(interner) == 0
+    interner(el.P["a"])
+    interner.clear()
+    assert len(interner) == 0
@@ -0,0 +1,52 @@
+import json
+import pickle
+
+import pytest
+
+from markupy import JsonScript
+from markupy import elements as el
+from markupy.exceptions import MarkupyError
+
+
+def test_json_script() -> None:
+    data = {"a": [1, 2.5, None, True], "b": "é"}
+    assert JsonScript(data) == """{"a":[1,2.5,null,true],"b":"é"}"""
+    assert (
+        el.Script(type="application/json")[JsonScript(data)]
+        == """<script type="application/json">{"a":[1,2.5,null,true],"b":"é"}</script>"""
+    )
+
+
+def test_json_script_escaping() -> None:
+    data = {"html": "</script><!-- & -->", "<key>": "\u2028\u2029"}
+    result = str(JsonScript(data))
+    assert result == (
+        '{"html":"\\u003c/script\\u003e\\u003c!-- \\u0026 --\\u003e",'
+        + '"\\u003ckey\\u003e":"\\u2028\\u2029"}'
+    )
+    assert "<" not in result and ">" not in result and "&" not in result
+    assert json.loads(result) == data
+
+
+def test_json_script_chunks() -> None:
+    data = [{"id": i, "label": f"<item {i}>"} for i in range(1000)]
+    chunks = list(JsonScript(data, buffer_size=100))
+    assert len(chunks) > 100
+    assert all(len(chunk) < 300 for chunk in chunks)
+    assert json.loads("".join(chunks)) == data
+
+
+def test_json_script_options() -> None:
+    assert JsonScript({"b": 1, "a": 2}, sort_keys=True) == """{"a":2,"b":1}"""
+    assert JsonScript({"a": "é"}, ensure_ascii=True) == """{"a":"\\u00e9"}"""
+    with pytest.raises(TypeError):
+        str(JsonScript(object()))
+    with pytest.raises(MarkupyError):
+        JsonScript(1, buffer_size=0)
+    with pytest.raises(MarkupyError):
+        JsonScript(1)["foo"]
+
+
+def test_json_script_pickle() -> None:
+    view = pickle.loads(pickle.dumps(JsonScript({"a": "<b>"})))
+    assert view == """{"a":"\\u003cb\\u003e"}"""
@@ -0,0 +1,47 @@
+import subprocess
+import sys
+
+import pytest
+
+import markupy
+
+
+def test_heavy_modules_not_imported() -> None:
+    code = "import sys, markupy, markupy.elements;print(','.join(sorted(sys.modules)))"
+    modules = subprocess.check_output([sys.executable, "-c", code], text=True)
+    imported = set(modules.strip().split(","))
+    for module in (
+        "asyncio",
+        "concurrent.futures",
+        "html.parser",
+        "json",
+        "markupy._private.html_to_markupy",
+        "markupy.attributes",
+        "multiprocessing",
+    ):
+        assert module not in imported
+
+
+def test_elements_not_imported() -> None:
+    code = "import sys, markupy;print(','.join(sorted(sys.modules)))"
+    modules = subprocess.check_output([sys.executable, "-c", code], text=True)
+    imported = set(modules.strip().split(","))
+    for module in (
+        "dataclasses",
+        "markupy._private.attributes.cache",
+        "markupy._private.views.compact",
+        "markupy._private.views.element",
+    ):
+        assert module not in imported
+
+
+def test_lazy_attributes() -> None:
+    for name in markupy.__all__:
+        assert getattr(markupy, name) is getattr(markupy, name)
+    assert set(markupy.__all__) <= set(dir(markupy))
+    assert markupy.Concurrent["hello"] == "hello"
+
+
+def test_unknown_attribute() -> None:
+    with pytest.raises(AttributeError, match="Unknown"):
+        markupy.Unknown
@@ -0,0 +1,128 @@
+import asyncio
+import threading
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from markupy import Component, Loader, View, iter_async
+from markupy import elements as el
+from markupy.exceptions import MarkupyError
+
+AUTHORS = {1: "Alice", 2: "Bob", 3: "Carol"}
+
+
+class AuthorCard(Component):
+    def __init__(self, *, loader: Loader[int, str], author_id: int) -> None:
+        super().__init__()
+        self.author = loader.load(author_id)
+
+    def render(self) -> View:
+        return el.Li[self.author.get()]
+
+
+def test_batched_loading() -> None:
+    batches: list[list[int]] = []
+
+    def load_authors(ids: list[int]) -> Mapping[int, str]:
+        batches.append(ids)
+        return {id: AUTHORS[id] for id in ids}
+
+    loader = Loader(load_authors)
+    authors = el.Ul[(AuthorCard(loader=loader, author_id=id) for id in [1, 2, 1, 3])]
+    assert batches == []
+    assert authors == "<ul><li>Alice</li><li>Bob</li><li>Alice</li><li>Carol</li></ul>"
+    assert batches == [[1, 2, 3]]
+
+    # Values are cached for the lifetime of the loader
+    str(authors)
+    assert loader.load(2).get() == "Bob"
+    assert batches == [[1, 2, 3]]
+
+
+def test_prime() -> None:
+    def load_authors(ids: list[int]) -> Mapping[int, str]:
+        assert ids == [2]
+        return {id: AUTHORS[id] for id in ids}
+
+    loader = Loader(load_authors)
+    first = loader.load(1)
+    loader.prime(1, "Dave")
+    assert loader.load(2).get() == "Bob"
+    assert first.get() == "Dave"
+
+
+def test_missing_key() -> None:
+    loader: Loader[int, str] = Loader(lambda ids: {})
+    with pytest.raises(MarkupyError):
+        loader.load(1).get()
+
+
+def test_async_batch_function() -> None:
+    async def load_authors(ids: list[int]) -> Mapping[int, str]:
+        return {id: AUTHORS[id] for id in ids}
+
+    loader = Loader(load_authors)
+    authors = el.Ul[(AuthorCard(loader=loader, author_id=id) for id in [3, 2])]
+    with pytest.raises(MarkupyError):
+        str(authors)
+
+    asyncio.run(loader.dispatch_async())
+    assert authors == "<ul><li>Carol</li><li>Bob</li></ul>"
+
+
+class AuthorList(Component):
+    def __init__(self, *, loader: Loader[int, str], author_ids: list[int]) -> None:
+        super().__init__()
+        self.loader = loader
+        self.author_ids = author_ids
+
+    def render(self) -> View:
+        # Nested components register their keys during rendering
+        return el.Ul[
+            (AuthorCard(loader=self.loader, author_id=id) for id in self.author_ids)
+        ]
+
+
+def test_async_batch_function_nested() -> None:
+    batches: list[list[int]] = []
+
+    async def load_authors(ids: list[int]) -> Mapping[int, str]:
+        await asyncio.sleep(0)
+        batches.append(ids)
+        return {id: AUTHORS[id] for id in ids}
+
+    async def render() -> str:
+        # The loader runs its batch function in the loop it is created from
+        loader = Loader(load_authors)
+        view = el.Div[
+            AuthorList(loader=loader, author_ids=[1, 2]),
+            AuthorList(loader=loader, author_ids=[3]),
+        ]
+        return "".join([chunk async for chunk in iter_async(view)])
+
+    assert asyncio.run(render()) == (
+        "<div><ul><li>Alice</li><li>Bob</li></ul><ul><li>Carol</li></ul></div>"
+    )
+    assert batches == [[1, 2], [3]]
+
+
+def test_load_during_fetch() -> None:
+    fetching = threading.Event()
+    release = threading.Event()
+
+    def load_authors(ids: list[int]) -> Mapping[int, str]:
+        fetching.set()
+        release.wait(timeout=5)
+        return {id: AUTHORS[id] for id in ids}
+
+    loader = Loader(load_authors)
+    first = loader.load(1)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(first.get)
+        assert fetching.wait(timeout=5)
+        # The lock is not held while fetching
+        second = loader.load(2)
+        release.set()
+        assert future.result(timeout=5) == "Alice"
+    assert second.get() == "Bob"
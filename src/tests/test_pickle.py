@@ -0,0 +1,111 @@
+import pickle
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+from markupsafe import Markup
+
+from markupy import Component, Concurrent, Fragment, View
+from markupy import elements as el
+from markupy._private.views.element import SPECIAL_ELEMENTS, get_element
+
+
+def roundtrip(obj: Any) -> Any:
+    return pickle.loads(pickle.dumps(obj))
+
+
+def python_name(html_name: str) -> str:
+    return "".join(word.capitalize() for word in html_name.split("-"))
+
+
+@pytest.mark.parametrize("name", SPECIAL_ELEMENTS)
+def test_shared_element(name: str) -> None:
+    element = get_element(python_name(name))
+    assert roundtrip(element) is element
+
+
+@pytest.mark.parametrize("name", SPECIAL_ELEMENTS)
+def test_element(name: str) -> None:
+    element = get_element(python_name(name))
+    if name != "_":
+        element = element("#id.cls", data_value='<">')
+    if type(element) is not type(el.Input):
+        element = element["Hello <", el.B["World"]]
+    result = roundtrip(element)
+    assert type(result) is type(element)
+    assert result._shared is False
+    assert result == element
+
+
+def test_custom_element() -> None:
+    assert roundtrip(el.MyCustomElement) is el.MyCustomElement
+    assert roundtrip(el.X1Input(foo="bar")) == """<x1-input foo="bar"></x1-input>"""
+
+
+def test_safe_element() -> None:
+    result = roundtrip(el.Script)
+    assert result['"<'] == """<script>"<</script>"""
+
+
+def test_flattened_children() -> None:
+    element = el.Div["a", Markup("<b>"), Fragment["c", el.I["d"], "e"], "f"]
+    result = roundtrip(element)
+    assert result == element
+    assert len(result._children) == 3
+    assert not isinstance(result._children[0], Markup)
+
+
+def test_fragment() -> None:
+    assert roundtrip(Fragment) == ""
+    assert roundtrip(Fragment)["<"] == "&lt;"
+    assert roundtrip(Fragment["a", el.P["b"]]) == "a<p>b</p>"
+    assert roundtrip(Concurrent(max_workers=2)[el.P["a"], el.P["b"]]) == (
+        "<p>a</p><p>b</p>"
+    )
+
+
+class PropsComponent(Component):
+    def __init__(self, title: str) -> None:
+        super().__init__()
+        self.title = title
+
+    def render(self) -> View:
+        return el.H1[self.title, self.render_content()]
+
+
+@dataclass(eq=False)
+class DataComponent(Component):
+    href: str
+
+    def render(self) -> View:
+        return el.A(href=self.href)[self.render_content()]
+
+
+def test_component() -> None:
+    assert roundtrip(PropsComponent("a")["b"]) == "<h1>ab</h1>"
+    assert roundtrip(DataComponent("/")["c"]) == """<a href="/">c</a>"""
+    assert roundtrip(el.Div[DataComponent("/")]) == """<div><a href="/"></a></div>"""
+
+
+def test_prototype() -> None:
+    row = roundtrip(el.Tr(".row").prototype())
+    assert row._shared is True
+    assert row[el.Td[1]] == """<tr class="row"><td>1</td></tr>"""
+    assert row == """<tr class="row"></tr>"""
+
+
+class Badge(View):
+    __slots__ = ("label",)
+
+    def __init__(self, label: str) -> None:
+        super().__init__()
+        self.label = label
+
+    def __iter__(self) -> Iterator[str]:
+        yield from el.B[self.label]
+
+
+def test_view_subclass() -> None:
+    assert roundtrip(Badge("x")) == "<b>x</b>"
+    assert roundtrip(el.Div[Badge("x")]) == "<div><b>x</b></div>"
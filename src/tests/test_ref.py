@@ -0,0 +1,91 @@
+import pickle
+import sys
+from pathlib import Path
+from textwrap import dedent
+
+import pytest
+
+from markupy import Component, Ref, View, elements
+from markupy._private.views.ref import _components
+from markupy.exceptions import MarkupyError
+
+
+class Greeting(Component):
+    def __init__(self, name: str = "world") -> None:
+        super().__init__()
+        self.name = name
+
+    def render(self) -> View:
+        return elements.P[f"Hello {self.name}", self.render_content()]
+
+
+GREETING = f"{__name__}.Greeting"
+
+
+def test_ref() -> None:
+    assert Ref(GREETING) == "<p>Hello world</p>"
+    assert Ref(GREETING, name="<you>") == "<p>Hello &lt;you&gt;</p>"
+
+
+def test_ref_children() -> None:
+    assert Ref(GREETING)[elements.Span["!"], "<"] == (
+        "<p>Hello world<span>!</span>&lt;</p>"
+    )
+
+
+def test_ref_in_element() -> None:
+    assert elements.Div[Ref(GREETING, name="ref")] == ("<div><p>Hello ref</p></div>")
+
+
+def test_ref_repr() -> None:
+    assert repr(Ref(GREETING)) == f"<markupy.Ref '{GREETING}'>"
+
+
+def test_ref_pickle() -> None:
+    ref = Ref(GREETING, name="pickle")["!"]
+    assert pickle.loads(pickle.dumps(ref)) == ref
+
+
+def test_lazy_import(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "lazy_components.py").write_text(
+        dedent(
+            """
+            from markupy import Component, View, elements
+
+            class Lazy(Component):
+                def render(self) -> View:
+                    return elements.Div["lazy"]
+            """
+        )
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    ref = elements.Main[Ref("lazy_components.Lazy")]
+    assert "lazy_components" not in sys.modules
+    assert ref == "<main><div>lazy</div></main>"
+    assert "lazy_components" in sys.modules
+    assert _components["lazy_components.Lazy"] is sys.modules["lazy_components"].Lazy
+    monkeypatch.delitem(sys.modules, "lazy_components")
+    monkeypatch.delitem(_components, "lazy_components.Lazy")
+
+
+def test_warmup() -> None:
+    _components.pop(GREETING, None)
+    Ref.warmup(GREETING)
+    assert _components[GREETING] is Greeting
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "Greeting",
+        "unknown_module.Component",
+        f"{__name__}.Unknown",
+        f"{__name__}.GREETING",
+    ],
+)
+def test_invalid_path(path: str) -> None:
+    ref = Ref(path)
+    with pytest.raises(MarkupyError):
+        str(ref)
+    with pytest.raises(MarkupyError):
+        Ref.warmup(path)
@@ -0,0 +1,114 @@
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import pytest
+
+from markupy import Attribute, Sharded, View, attribute_handlers, strict_mode
+from markupy import elements as el
+from markupy.exceptions import MarkupyError
+
+
+def render_row(row: int) -> View:
+    return el.Tr[el.Td[row], el.Td["<"]]
+
+
+def fail_row(row: int) -> View:
+    raise ValueError(row)
+
+
+def expected(rows: range) -> str:
+    return "".join(f"<tr><td>{row}</td><td>&lt;</td></tr>" for row in rows)
+
+
+def test_sharded() -> None:
+    rows = range(25)
+    result = el.Tbody[Sharded(render_row, rows, shard_size=4, max_workers=2)]
+    assert result == f"<tbody>{expected(rows)}</tbody>"
+
+
+def test_sharded_generator() -> None:
+    rows = range(10)
+    result = Sharded(render_row, (row for row in rows), shard_size=3, max_workers=2)
+    assert result == expected(rows)
+    # Items are not lost after a first render
+    assert str(result) == expected(rows)
+    assert "".join(result) == expected(rows)
+
+
+def test_single_shard() -> None:
+    assert Sharded(render_row, [1, 2]) == expected(range(1, 3))
+    assert Sharded(render_row, []) == ""
+
+
+def test_sharded_error() -> None:
+    with pytest.raises(ValueError):
+        str(Sharded(fail_row, range(10), shard_size=2, max_workers=2))
+
+
+def test_sharded_invalid() -> None:
+    with pytest.raises(MarkupyError):
+        Sharded(render_row, [], shard_size=0)
+    with pytest.raises(MarkupyError):
+        Sharded(render_row, [])["child"]
+
+
+def cdn_handler(old: Attribute | None, new: Attribute) -> Attribute | None:
+    new.value = f"https://cdn{new.value}"
+    return None
+
+
+def register_cdn_handler() -> None:
+    attribute_handlers.register(cdn_handler, names=["src"])
+
+
+def render_image(row: int) -> View:
+    return el.Img(src=f"/{row}.png")
+
+
+def render_class(row: int) -> View:
+    # Uninstantiated class, only accepted in non-strict mode
+    return el.P[Exception]
+
+
+@pytest.fixture(scope="module")
+def spawn_executor() -> Iterator[ProcessPoolExecutor]:
+    with ProcessPoolExecutor(
+        max_workers=2,
+        mp_context=get_context("spawn"),
+        initializer=register_cdn_handler,
+    ) as executor:
+        yield executor
+
+
+def test_sharded_executor(spawn_executor: ProcessPoolExecutor) -> None:
+    register_cdn_handler()
+    try:
+        expected = "".join(f'<img src="https://cdn/{row}.png">' for row in range(4))
+        for shard_size in (2, 4):
+            result = Sharded(
+                render_image, range(4), shard_size=shard_size, executor=spawn_executor
+            )
+            assert result == expected
+    finally:
+        attribute_handlers.unregister(cdn_handler)
+
+
+def test_sharded_strict_mode(spawn_executor: ProcessPoolExecutor) -> None:
+    view = Sharded(render_class, range(4), shard_size=2, executor=spawn_executor)
+    with strict_mode(False):
+        assert view == "<p>&lt;class &#39;Exception&#39;&gt;</p>" * 4
+    with pytest.raises(MarkupyError):
+        str(view)
+
+
+def test_sharded_overlay() -> None:
+    with attribute_handlers.scope():
+        with pytest.raises(MarkupyError):
+            str(Sharded(render_row, range(4), shard_size=2))
+
+
+def test_sharded_executor_options() -> None:
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(MarkupyError):
+            Sharded(render_row, [], executor=executor, initializer=register_cdn_handler)
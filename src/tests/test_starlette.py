@@ -2,7 +2,7 @@
 from starlette.responses import HTMLResponse, StreamingResponse
 from starlette.testclient import TestClient
 
-from markupy import elements
+from markupy import elements, iter_async
 
 
 async def render(scope, receive, send):
@@ -17,6 +17,14 @@ async def stream(scope, receive, send):
     await response(scope, receive, send)
 
 
+async def stream_async(scope, receive, send):
+    assert scope["type"] == "http"
+    response = StreamingResponse(
+        iter_async(elements.Ul[(elements.Li[i] for i in range(3))], buffer_size=1)
+    )
+    await response(scope, receive, send)
+
+
 def test_render() -> None:
     client = TestClient(render)
     response = client.get("/")
@@ -27,3 +35,9 @@ def test_stream() -> None:
     client = TestClient(stream)
     response = client.get("/")
     assert response.text == """<h1 class="title">stream</h1>"""
+
+
+def test_stream_async() -> None:
+    client = TestClient(stream_async)
+    response = client.get("/")
+    assert response.text == """<ul><li>0</li><li>1</li><li>2</li></ul>"""
@@ -0,0 +1,90 @@
+import asyncio
+import threading
+
+import pytest
+
+from markupy import Component, View, iter_async
+from markupy import elements as el
+from markupy.exceptions import MarkupyError
+
+
+class CountingComponent(Component):
+    def __init__(self, counter: list[int]) -> None:
+        super().__init__()
+        self.counter = counter
+
+    def render(self) -> View:
+        self.counter.append(threading.get_ident())
+        return el.Li[len(self.counter)]
+
+
+class ErrorComponent(Component):
+    def render(self) -> View:
+        raise ValueError("boom")
+
+
+async def collect(view: View, **kwargs: int) -> list[str]:
+    return [chunk async for chunk in iter_async(view, **kwargs)]
+
+
+def test_iter_async() -> None:
+    counter: list[int] = []
+    view = el.Ul[(CountingComponent(counter) for _ in range(3))]
+    chunks = asyncio.run(collect(view))
+    assert "".join(chunks) == "<ul><li>1</li><li>2</li><li>3</li></ul>"
+    # Whole output fits into a single buffer
+    assert len(chunks) == 1
+    # Rendering happened in a worker thread
+    assert threading.get_ident() not in counter
+
+
+def test_iter_async_buffer() -> None:
+    chunks = asyncio.run(collect(el.P["hello"], buffer_size=1))
+    assert chunks == ["<p>", "hello", "</p>"]
+
+
+def test_iter_async_error() -> None:
+    with pytest.raises(ValueError):
+        asyncio.run(collect(el.Div[ErrorComponent()]))
+    with pytest.raises(MarkupyError):
+        asyncio.run(collect(el.Div, max_queued=0))
+
+
+def test_iter_async_backpressure_and_cancel() -> None:
+    counter: list[int] = []
+    view = el.Ul[(CountingComponent(counter) for _ in range(100))]
+
+    async def consume_first() -> str:
+        chunks = iter_async(view, buffer_size=1, max_queued=1)
+        first = await chunks.__anext__()
+        # Give some time to the worker: it must be blocked by the full queue
+        await asyncio.sleep(0.1)
+        assert len(counter) < 10
+        await chunks.aclose()
+        await asyncio.sleep(0.1)
+        return first
+
+    assert asyncio.run(consume_first()) == "<ul>"
+    # Worker stopped after the consumer went away
+    assert len(counter) < 10
+
+
+def test_iter_async_cancel_short_output() -> None:
+    # The worker is done rendering but still waiting to queue its last items
+    # when the consumer goes away: it must not stay blocked forever
+    async def consume_first() -> str:
+        chunks = iter_async(el.Div["x"], buffer_size=1, max_queued=1)
+        first = await chunks.__anext__()
+        await asyncio.sleep(0.2)
+        await chunks.aclose()
+        return first
+
+    results: list[str] = []
+    # Daemon thread: a deadlock must fail the test instead of hanging pytest
+    thread = threading.Thread(
+        target=lambda: results.append(asyncio.run(consume_first())), daemon=True
+    )
+    thread.start()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert results == ["<div>"]
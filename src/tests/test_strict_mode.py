@@ -0,0 +1,70 @@
+from collections.abc import Iterator
+
+import pytest
+
+from markupy import View, set_strict_mode, strict_mode
+from markupy import elements as el
+from markupy.exceptions import MarkupyError
+
+
+@pytest.fixture
+def non_strict() -> Iterator[None]:
+    set_strict_mode(False)
+    yield
+    set_strict_mode(True)
+
+
+def uncalled() -> View:
+    return el.P
+
+
+def test_strict_mode_default() -> None:
+    with pytest.raises(MarkupyError):
+        el.Div[uncalled]
+    with pytest.raises(MarkupyError):
+        el.Div(Foo="bar")
+
+
+@pytest.mark.usefixtures("non_strict")
+def test_non_strict_mode() -> None:
+    # Checks are skipped, but output is still escaped
+    assert (
+        el.Div[uncalled]
+        == f"<div>&lt;function uncalled at {hex(id(uncalled))}&gt;</div>"
+    )
+    assert el.Div(Foo="bar") == """<div Foo="bar"></div>"""
+
+    # Checks protecting output are kept
+    with pytest.raises(MarkupyError):
+        el.Div(**{"foo bar": "baz"})
+    with pytest.raises(MarkupyError):
+        el.Div({'foo"bar': "baz"})
+    with pytest.raises(MarkupyError):
+        el.Div(foo=[])  # type: ignore[call-overload]
+
+
+@pytest.mark.usefixtures("non_strict")
+def test_non_strict_mode_output() -> None:
+    def build() -> View:
+        return el.Div(".a", {"data-x": 1}, id="x", class_="b", hx_get="/<url>")[
+            "<text>", None, False, [el.Br, 1, 2.5], el.Script["<safe>"]
+        ]
+
+    view = build()
+    with strict_mode(True):
+        strict_output = str(build())
+    assert view == strict_output
+    assert (
+        view
+        == """<div class="a b" data-x="1" id="x" hx-get="/&lt;url&gt;">&lt;text&gt;<br>12.5<script><safe></script></div>"""
+    )
+
+
+def test_strict_mode_context() -> None:
+    with strict_mode(False):
+        assert el.Div(Foo="bar") == """<div Foo="bar"></div>"""
+        with strict_mode(True):
+            with pytest.raises(MarkupyError):
+                el.Div(Foo="bar")
+    with pytest.raises(MarkupyError):
+        el.Div(Foo="bar")